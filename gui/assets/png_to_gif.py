@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Convert card and chip PNG assets to palette GIFs
+
+Tk decodes GIF far faster than PNG (especially on Windows), and the GUI
+prefers `{name}.gif` over `{name}.png` when both exist. Run this once after
+adding or changing PNG assets:
+
+    python gui/assets/png_to_gif.py
+
+Uses only tkinter, so it needs a display but no extra packages. Images with
+more than 256 colors are reduced to a 3-3-2 bit palette before saving.
+The PNGs are left in place as a fallback.
+"""
+
+import os
+import sys
+import tkinter as tk
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGE_DIRS = ['cards', 'chips']
+
+
+def quantize(img: tk.PhotoImage) -> tk.PhotoImage:
+    """
+    Reduce an image to at most 256 colors (3 bits red, 3 green, 2 blue)
+
+    Args:
+        img: Source image
+
+    Returns:
+        New PhotoImage of the same size using the reduced palette
+    """
+    width, height = img.width(), img.height()
+    reduced = tk.PhotoImage(width=width, height=height)
+
+    for y in range(height):
+        row = []
+        for x in range(width):
+            r, g, b = img.get(x, y)
+            row.append(f"#{r & 0xE0:02x}{g & 0xE0:02x}{b & 0xC0:02x}")
+        reduced.put("{" + " ".join(row) + "}", to=(0, y))
+
+        # Carry over fully transparent pixels (GIF has no partial alpha)
+        for x in range(width):
+            if img.transparency_get(x, y):
+                reduced.transparency_set(x, y, True)
+
+    return reduced
+
+
+def convert_directory(path: str) -> int:
+    """
+    Write a .gif next to every .png in a directory
+
+    Args:
+        path: Directory to convert
+
+    Returns:
+        Number of images converted
+    """
+    if not os.path.isdir(path):
+        return 0
+
+    converted = 0
+    for filename in sorted(os.listdir(path)):
+        if not filename.endswith('.png'):
+            continue
+
+        png_path = os.path.join(path, filename)
+        gif_path = png_path[:-4] + '.gif'
+
+        img = tk.PhotoImage(file=png_path)
+        try:
+            img.write(gif_path, format='gif')
+        except tk.TclError:
+            # Tk's GIF writer refuses images with more than 256 colors
+            quantize(img).write(gif_path, format='gif')
+
+        print(f"{filename} -> {os.path.basename(gif_path)}")
+        converted += 1
+
+    return converted
+
+
+def main():
+    root = tk.Tk()
+    root.withdraw()
+
+    total = 0
+    for directory in IMAGE_DIRS:
+        total += convert_directory(os.path.join(ASSETS_DIR, directory))
+
+    root.destroy()
+    print(f"Converted {total} image(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,24 +6,243 @@ Windows 95 Hearts-style interface
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-from typing import List, Optional
+from tkinter import font as tkfont
+from typing import Dict, List, Optional, Tuple
 import os
 import sys
+import base64
+import itertools
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path so we can import game modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sabacc_game import GameState, Player, Card, calculate_hand_value, get_random_opponent_names
+from sabacc_game import (GameState, Player, Card, Deck, SUIT_NAMES, calculate_hand_value,
+                         get_random_opponent_names)
 from sabacc_ai import get_simple_ai_action
 from sabacc_trionfi import get_playable_trionfi, get_trionfi_effect
 
 
+# Font specs, turned into shared tkinter Font objects by _create_fonts() at startup
+FONT_SPECS = {
+    'title12b': ('Arial', 12, 'bold'),  # Card ranks, table labels, info panel, dialog titles
+    'label12': ('Arial', 12),
+    'pip11b': ('Arial', 11, 'bold'),    # Pile counts
+    'item11': ('Arial', 11),
+    'label10b': ('Arial', 10, 'bold'),  # Opponent names, chip values, dialog headings
+    'label10': ('Arial', 10),
+    'badge9b': ('Arial', 9, 'bold'),    # Value and count badges
+    'label9': ('Arial', 9),
+    'note9i': ('Arial', 9, 'italic'),
+    'name7': ('Arial', 7),              # Trionfi names on cards
+    'suit32': ('Arial', 32),            # Suit symbol on card faces
+    'back48': ('Arial', 48),            # Card back pattern
+    'pot14b': ('Arial', 14, 'bold'),
+    'mono10': ('Courier', 10),
+}
+FONTS: Dict[str, tkfont.Font] = {}
+
+
+def _create_fonts() -> Dict[str, tkfont.Font]:
+    """
+    Create the shared Font objects (once, after the Tk root exists)
+
+    Tk resolves a Font object once instead of re-parsing a font tuple on
+    every create_text()/widget construction.
+
+    Returns:
+        The module-level FONTS dict, keyed like FONT_SPECS
+    """
+    if not FONTS:
+        for name, (family, size, *styles) in FONT_SPECS.items():
+            FONTS[name] = tkfont.Font(
+                family=family, size=size,
+                weight='bold' if 'bold' in styles else 'normal',
+                slant='italic' if 'italic' in styles else 'roman'
+            )
+    return FONTS
+
+# Table layout (top-left canvas coordinates)
+OPPONENT_X = 50            # First opponent's name/cards
+OPPONENT_SPACING = 250     # Horizontal gap between opponents
+OPPONENT_Y = 20
+OPPONENT_CARD_OFFSET = 30  # Opponent cards sit below the name
+OPPONENT_CARD_SPACING = 20  # Opponent cards overlap
+DISCARD_XY = (50, 200)
+DRAW_PILE_XY = (140, 200)
+COMMUNITY_XY = (400, 200)
+POT_XY = (500, 320)
+PLAYER_HAND_XY = (300, 380)
+CARD_SPACING = 80          # Community and player cards sit side by side
+LAYOUT_HAND_SLOTS = 8      # Hand slots laid out up front; larger hands are filled in lazily
+
+UI_QUEUE_POLL_MS = 16      # How often the Tk thread picks up updates posted by the AI worker
+
+# Game pacing, used by SabaccGUI._chain(); 0 runs the next step as soon as Tk is idle
+PACE_STEP_MS = 0           # Between turns and betting rounds
+PACE_NEW_HAND_MS = 300     # Showdown result on screen before the new-hand prompt
+TOAST_MS = 1500            # How long an informational banner stays up
+
+
+@lru_cache(maxsize=128)
+def _card_value(card: Card) -> int:
+    """
+    Get the value of a single card (memoized; the deck has fewer than 80 cards)
+
+    Args:
+        card: Card tuple (rank, suit)
+
+    Returns:
+        The card's value on its own, as calculate_hand_value() scores it
+    """
+    return calculate_hand_value([card])[0]
+
+
+@lru_cache(maxsize=4096)
+def _eval_cached(hand_key: Tuple[Card, ...]) -> Tuple[int, bool]:
+    """Score a sorted hand tuple (memoized; see _hand_value())"""
+    return calculate_hand_value(list(hand_key))
+
+
+def _hand_value(hand) -> Tuple[int, bool]:
+    """
+    Score a hand, reusing the result for any hand with the same cards
+
+    Scoring doesn't depend on card order, so the sorted cards make the cache
+    key and any change to the hand naturally gives a new key.
+
+    Args:
+        hand: List of card tuples
+
+    Returns:
+        (value, busted) as from calculate_hand_value()
+    """
+    return _eval_cached(tuple(sorted(hand)))
+
+
+@lru_cache(maxsize=128)
+def _card_label(card: Card) -> str:
+    """
+    Format a card for list dialogs, e.g. ' 7 of Cups     (value:   7)'
+
+    Args:
+        card: Card tuple (rank, suit)
+
+    Returns:
+        Fixed-width name and value text (memoized per card)
+    """
+    rank, suit = card
+    value = _card_value(card)
+
+    if suit == 'T':
+        trionfi = get_trionfi_effect(card)
+        name = trionfi.name if trionfi else f"Trionfo {rank}"
+        return f"{name:<20} (value: {value:>3})"
+
+    suit_name = SUIT_NAMES.get(suit, suit)
+    return f"{rank:>2} of {suit_name:<8} (value: {value:>3})"
+
+
+def _raise(error: BaseException):
+    """Raise an exception passed over from another thread"""
+    raise error
+
+
+def _scan_asset_dir(path: str) -> frozenset:
+    """
+    List the files in an asset directory with a single scandir
+
+    Args:
+        path: Asset directory to scan
+
+    Returns:
+        Frozenset of filenames (empty if the directory doesn't exist)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
+
+def _pick_image_file(name: str, available) -> Optional[str]:
+    """
+    Choose the asset file to load for an image name
+
+    Args:
+        name: Image name without extension (e.g. '5_W', 'chip_25')
+        available: Set of filenames present in the asset directory
+
+    Returns:
+        '{name}.gif' if present, else '{name}.png' if present, else None
+    """
+    for ext in ('.gif', '.png'):
+        if name + ext in available:
+            return name + ext
+    return None
+
+
+def _read_image_data(path: str) -> bytes:
+    """Read an image file and base64-encode it for PhotoImage(data=...) (worker thread)"""
+    with open(path, 'rb') as f:
+        return base64.b64encode(f.read())
+
+
+def _prefetch_images(root, jobs, on_complete=None):
+    """
+    Read image files on worker threads and build the PhotoImages on the Tk thread
+
+    Tk objects may only be created on the main thread, so the workers just
+    read the files; the main thread polls for finished reads and turns each
+    one into a PhotoImage as it arrives.
+
+    Args:
+        root: Tk root window, used to schedule the polling
+        jobs: List of (cache, cache_key, path) tuples
+        on_complete: Optional callback run once every image is in its cache
+    """
+    if not jobs:
+        if on_complete:
+            on_complete()
+        return
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    pending = [(cache, key, path, executor.submit(_read_image_data, path))
+               for cache, key, path in jobs]
+    executor.shutdown(wait=False)
+
+    def poll():
+        still_pending = []
+        for job in pending:
+            cache, key, path, future = job
+            if not future.done():
+                still_pending.append(job)
+                continue
+            try:
+                cache[key] = tk.PhotoImage(data=future.result())
+            except (OSError, tk.TclError) as e:
+                print(f"Warning: Failed to load image {os.path.basename(path)}: {e}")
+
+        pending[:] = still_pending
+        if pending:
+            root.after(10, poll)
+        elif on_complete:
+            on_complete()
+
+    root.after(0, poll)
+
+
 class CardWidget:
     """Represents a visual card that can be clicked"""
 
     # Card dimensions
     CARD_WIDTH = 71
     CARD_HEIGHT = 96
+    SELECTED_LIFT = 10  # Selected cards are drawn this many pixels higher
 
     # Suit symbols (using Unicode)
     SUIT_SYMBOLS = {
@@ -45,6 +264,12 @@ class CardWidget:
 
     # Image cache (class variable to persist across instances)
     _image_cache = {}
+    _asset_manifest = frozenset()  # Filenames in assets/cards/, scanned once by preload()
+
+    # Trionfi effects filled in by preload(); a card's effect never changes
+    _trionfi_cache = {}
+
+    _tag_ids = itertools.count(1)
     _assets_path = None
 
     @classmethod
@@ -56,46 +281,52 @@ class CardWidget:
             cls._assets_path = os.path.join(gui_dir, 'assets')
         return cls._assets_path
 
+    @classmethod
+    def preload(cls):
+        """
+        Fill the per-card caches and list the card images to load.
+
+        Must be called once after the Tk root exists. A single directory
+        listing decides which images are present, so draw() never has to
+        touch the filesystem.
+
+        Returns:
+            List of (cache, cache_key, path) jobs for _prefetch_images()
+        """
+        cards_path = os.path.join(cls._get_assets_path(), 'cards')
+        cls._asset_manifest = _scan_asset_dir(cards_path)
+
+        deck_cards = Deck().cards
+        for card in deck_cards:
+            _card_value(card)  # Warm the value cache
+            if card[1] == 'T':
+                cls._trionfi_cache[card] = get_trionfi_effect(card)
+
+        # Every card in the deck plus the shared card back
+        wanted = [(card, f"{card[0]}_{card[1]}") for card in deck_cards]
+        wanted.append(('card_back', 'card_back'))
+
+        jobs = []
+        for cache_key, name in wanted:
+            # Prefer a palette GIF when present; Tk decodes GIF much faster than PNG
+            filename = _pick_image_file(name, cls._asset_manifest)
+            if filename is not None:
+                jobs.append((cls._image_cache, cache_key, os.path.join(cards_path, filename)))
+        return jobs
+
     @classmethod
     def _load_card_image(cls, card: Card, is_back: bool = False):
         """
-        Try to load a card image from assets/cards/
+        Look up a preloaded card image
 
         Args:
             card: The card tuple (rank, suit)
-            is_back: If True, load card back image
+            is_back: If True, return the card back image
 
         Returns:
             PhotoImage object if found, None otherwise
         """
-        if is_back:
-            cache_key = 'card_back'
-            filename = 'card_back.png'
-        else:
-            rank, suit = card
-            cache_key = f"{rank}_{suit}"
-            filename = f"{rank}_{suit}.png"
-
-        # Check cache first
-        if cache_key in cls._image_cache:
-            return cls._image_cache[cache_key]
-
-        # Try to load image
-        assets_path = cls._get_assets_path()
-        cards_path = os.path.join(assets_path, 'cards')
-        image_path = os.path.join(cards_path, filename)
-
-        if os.path.exists(image_path):
-            try:
-                # Load image using PhotoImage (supports PNG, GIF)
-                img = tk.PhotoImage(file=image_path)
-                cls._image_cache[cache_key] = img
-                return img
-            except Exception as e:
-                print(f"Warning: Failed to load card image {filename}: {e}")
-                return None
-
-        return None
+        return cls._image_cache.get('card_back' if is_back else card)
 
     def __init__(self, canvas, card: Card, x: int, y: int,
                  face_up: bool = True, clickable: bool = False,
@@ -111,20 +342,26 @@ class CardWidget:
         self.selected = False
         self.card_id = None
         self.text_ids = []
+        self.face_ids = {}  # Role ('rank', 'suit', 'name', 'value', ...) -> item id on a drawn card face
         self.image_ref = None  # Keep reference to prevent garbage collection
 
+        # Every item this widget draws carries its own tag, so the whole card
+        # can be moved, hidden or raised with one canvas call. Opponent cards
+        # also join their player's group tag (e.g. 'player_2').
+        self.tag = f"card{next(CardWidget._tag_ids)}"
+        self.group = None
+        self._tags = (self.tag,)
+
         self.draw()
+        self._bind_clicks()
 
     def draw(self):
         """Draw the card on the canvas (tries to load image, falls back to programmatic drawing)"""
         # Clear previous drawing
-        if self.card_id:
-            self.canvas.delete(self.card_id)
-            for text_id in self.text_ids:
-                self.canvas.delete(text_id)
-            self.text_ids = []
+        self.clear()
 
-        y_offset = -10 if self.selected else 0
+        self._tags = self._item_tags()
+        y_offset = -self.SELECTED_LIFT if self.selected else 0
 
         # Try to load image first
         if self.face_up:
@@ -137,24 +374,27 @@ class CardWidget:
             self.card_id = self.canvas.create_image(
                 self.x + self.CARD_WIDTH // 2,
                 self.y + self.CARD_HEIGHT // 2 + y_offset,
-                image=self.image_ref
+                image=self.image_ref,
+                tags=self._tags
             )
 
             # Still show value badge if requested (overlaid on image)
             if self.face_up and self.show_value:
-                value, _ = calculate_hand_value([self.card])
+                value = _card_value(self.card)
                 badge_x = self.x + self.CARD_WIDTH - 18
                 badge_y = self.y + 12 + y_offset
                 badge = self.canvas.create_oval(
                     badge_x - 12, badge_y - 10,
                     badge_x + 12, badge_y + 10,
-                    fill='#333333', outline='white', width=1
+                    fill='#333333', outline='white', width=1,
+                    tags=self._tags
                 )
                 self.text_ids.append(badge)
                 value_text = self.canvas.create_text(
                     badge_x, badge_y,
-                    text=str(value), font=('Arial', 9, 'bold'),
-                    fill='white'
+                    text=str(value), font=FONTS['badge9b'],
+                    fill='white',
+                    tags=self._tags
                 )
                 self.text_ids.append(value_text)
 
@@ -162,11 +402,37 @@ class CardWidget:
         else:
             self._draw_programmatic(y_offset)
 
-        # Bind click event if clickable
+    def _item_tags(self) -> tuple:
+        """Tags for newly drawn items: the card's own tag, its group, and 'card_back' if face down"""
+        tags = (self.tag,)
+        if self.group:
+            tags += (self.group,)
+        if not self.face_up:
+            tags += ('card_back',)
+        return tags
+
+    def set_group(self, group: Optional[str]):
+        """
+        Move the card into a group tag (or out of any group)
+
+        Args:
+            group: Group tag such as 'player_2', or None
+        """
+        if group == self.group:
+            return
+        if self.group:
+            self.canvas.dtag(self.tag, self.group)
+        if group:
+            self.canvas.addtag_withtag(group, self.tag)
+        self.group = group
+        self._tags = self._item_tags()
+
+    def _bind_clicks(self):
+        """Bind (or unbind) clicks on the card's tag; covers items drawn later too"""
         if self.clickable:
-            self.canvas.tag_bind(self.card_id, '<Button-1>', self.on_click)
-            for text_id in self.text_ids:
-                self.canvas.tag_bind(text_id, '<Button-1>', self.on_click)
+            self.canvas.tag_bind(self.tag, '<Button-1>', self.on_click)
+        else:
+            self.canvas.tag_unbind(self.tag, '<Button-1>')
 
     def _draw_programmatic(self, y_offset: int):
         """Draw card using programmatic drawing (fallback when no image available)"""
@@ -178,7 +444,8 @@ class CardWidget:
             self.card_id = self.canvas.create_rectangle(
                 self.x, self.y + y_offset,
                         self.x + self.CARD_WIDTH, self.y + self.CARD_HEIGHT + y_offset,
-                fill=fill_color, outline=outline_color, width=2
+                fill=fill_color, outline=outline_color, width=2,
+                tags=self._tags
             )
 
             rank, suit = self.card
@@ -188,70 +455,83 @@ class CardWidget:
             # Display rank (top-left and bottom-right)
             rank_text = self.canvas.create_text(
                 self.x + 10, self.y + 15 + y_offset,
-                text=rank, font=('Arial', 12, 'bold'),
-                fill=suit_color
+                text=rank, font=FONTS['title12b'],
+                fill=suit_color,
+                tags=self._tags
             )
             self.text_ids.append(rank_text)
+            self.face_ids['rank'] = rank_text
 
             rank_text2 = self.canvas.create_text(
                 self.x + self.CARD_WIDTH - 10, self.y + self.CARD_HEIGHT - 15 + y_offset,
-                text=rank, font=('Arial', 12, 'bold'),
-                fill=suit_color
+                text=rank, font=FONTS['title12b'],
+                fill=suit_color,
+                tags=self._tags
             )
             self.text_ids.append(rank_text2)
+            self.face_ids['rank2'] = rank_text2
 
             # Display suit symbol (center)
             suit_text = self.canvas.create_text(
                 self.x + self.CARD_WIDTH // 2, self.y + self.CARD_HEIGHT // 2 + y_offset,
-                text=suit_symbol, font=('Arial', 32),
-                fill=suit_color
+                text=suit_symbol, font=FONTS['suit32'],
+                fill=suit_color,
+                tags=self._tags
             )
             self.text_ids.append(suit_text)
+            self.face_ids['suit'] = suit_text
 
             # If it's a Trionfi with a name, show it
             if suit == 'T':
-                trionfi = get_trionfi_effect(self.card)
+                trionfi = self._trionfi_cache.get(self.card)
                 if trionfi:
                     name_text = self.canvas.create_text(
                         self.x + self.CARD_WIDTH // 2, self.y + self.CARD_HEIGHT - 30 + y_offset,
-                        text=trionfi.name, font=('Arial', 7),
-                        fill=suit_color, width=self.CARD_WIDTH - 10
+                        text=trionfi.name, font=FONTS['name7'],
+                        fill=suit_color, width=self.CARD_WIDTH - 10,
+                        tags=self._tags
                     )
                     self.text_ids.append(name_text)
+                    self.face_ids['name'] = name_text
 
             # Show value badge if requested
             if self.show_value:
-                value, _ = calculate_hand_value([self.card])
+                value = _card_value(self.card)
                 # Draw badge background
                 badge_x = self.x + self.CARD_WIDTH - 18
                 badge_y = self.y + 12 + y_offset
                 badge = self.canvas.create_oval(
                     badge_x - 12, badge_y - 10,
                     badge_x + 12, badge_y + 10,
-                    fill='#333333', outline='white', width=1
+                    fill='#333333', outline='white', width=1,
+                    tags=self._tags
                 )
                 self.text_ids.append(badge)
                 # Draw value text
                 value_text = self.canvas.create_text(
                     badge_x, badge_y,
-                    text=str(value), font=('Arial', 9, 'bold'),
-                    fill='white'
+                    text=str(value), font=FONTS['badge9b'],
+                    fill='white',
+                    tags=self._tags
                 )
                 self.text_ids.append(value_text)
+                self.face_ids['value'] = value_text
 
         else:
             # Draw card back
             self.card_id = self.canvas.create_rectangle(
                 self.x, self.y + y_offset,
                         self.x + self.CARD_WIDTH, self.y + self.CARD_HEIGHT + y_offset,
-                fill='#8B0000', outline='#000000', width=2
+                fill='#8B0000', outline='#000000', width=2,
+                tags=self._tags
             )
 
             # Add pattern to card back
             pattern_text = self.canvas.create_text(
                 self.x + self.CARD_WIDTH // 2, self.y + self.CARD_HEIGHT // 2 + y_offset,
-                text='⛝', font=('Arial', 48),
-                fill='#FFD700'
+                text='⛝', font=FONTS['back48'],
+                fill='#FFD700',
+                tags=self._tags
             )
             self.text_ids.append(pattern_text)
 
@@ -261,13 +541,130 @@ class CardWidget:
             self.on_click_callback(self.card)
         else:
             self.selected = not self.selected
-            self.draw()
+            # Just lift or drop the existing items
+            self.canvas.move(self.tag, 0, -self.SELECTED_LIFT if self.selected else self.SELECTED_LIFT)
 
     def move_to(self, x: int, y: int):
         """Move card to new position"""
+        dx = x - self.x
+        dy = y - self.y
         self.x = x
         self.y = y
+
+        # Shift the existing items rather than recreating them
+        if dx or dy:
+            self.canvas.move(self.tag, dx, dy)
+
+    def set_card(self, card: Card, face_up: bool) -> bool:
+        """
+        Show a different card in this widget, reusing canvas items where possible
+
+        Args:
+            card: The card tuple (rank, suit) to show
+            face_up: Whether the card should be shown face up
+
+        Returns:
+            True if the canvas items had to be recreated, False otherwise
+        """
+        if card == self.card and face_up == self.face_up:
+            return False
+
+        was_selected = self.selected
+        self.card = card
+        self.face_up = face_up
+        self.selected = False
+
+        # A plain image card can flip to another image with a single itemconfigure
+        new_image = self._load_card_image(card, is_back=not face_up)
+        if new_image and self.image_ref and not self.text_ids:
+            if was_selected:
+                self.canvas.move(self.tag, 0, self.SELECTED_LIFT)
+            self.image_ref = new_image
+            self.canvas.itemconfigure(self.card_id, image=new_image)
+
+            # Keep the 'card_back' tag in step with the flip
+            if face_up:
+                self.canvas.dtag(self.tag, 'card_back')
+            else:
+                self.canvas.addtag_withtag('card_back', self.tag)
+            self._tags = self._item_tags()
+            return False
+
+        # A drawn face can show another drawn face by retexting its items,
+        # as long as both need the same set of items (Trionfi name or not)
+        if (face_up and self.face_ids and not new_image and not self.image_ref
+                and ('name' in self.face_ids) == self._has_trionfi_name(card)):
+            if was_selected:
+                self.canvas.move(self.tag, 0, self.SELECTED_LIFT)
+            self._retext_face()
+            return False
+
         self.draw()
+        return True
+
+    def _has_trionfi_name(self, card: Card) -> bool:
+        """Whether a drawn face for this card includes a Trionfi name line"""
+        return card[1] == 'T' and self._trionfi_cache.get(card) is not None
+
+    def _retext_face(self):
+        """Update the text items of a drawn card face to show self.card"""
+        rank, suit = self.card
+        suit_color = self.SUIT_COLORS.get(suit, '#000000')
+        itemconfigure = self.canvas.itemconfigure
+
+        itemconfigure(self.face_ids['rank'], text=rank, fill=suit_color)
+        itemconfigure(self.face_ids['rank2'], text=rank, fill=suit_color)
+        itemconfigure(self.face_ids['suit'], text=self.SUIT_SYMBOLS.get(suit, '?'), fill=suit_color)
+        if 'name' in self.face_ids:
+            itemconfigure(self.face_ids['name'], text=self._trionfi_cache[self.card].name,
+                          fill=suit_color)
+        if 'value' in self.face_ids:
+            itemconfigure(self.face_ids['value'], text=str(_card_value(self.card)))
+
+    def retarget(self, card: Card, x: int, y: int, face_up: bool = True,
+                 clickable: bool = False, on_click_callback=None):
+        """
+        Reuse this widget for another card and position, updating items in place
+
+        Args:
+            card: The card tuple (rank, suit) to show
+            x, y: New top-left position
+            face_up: Whether the card should be shown face up
+            clickable: Whether clicking the card toggles selection
+            on_click_callback: Optional callback for clicks
+        """
+        if self.selected and card == self.card:
+            # A recycled card starts out unselected
+            self.selected = False
+            self.canvas.move(self.tag, 0, self.SELECTED_LIFT)
+        self.set_card(card, face_up)
+        self.move_to(x, y)
+
+        self.on_click_callback = on_click_callback
+        if clickable != self.clickable:
+            self.clickable = clickable
+            self._bind_clicks()
+
+        self.show()
+
+    def hide(self):
+        """Hide the card without deleting its items"""
+        self.canvas.itemconfigure(self.tag, state='hidden')
+
+    def show(self):
+        """Show a hidden card again"""
+        self.canvas.itemconfigure(self.tag, state='normal')
+
+    def raise_to_top(self):
+        """Restack this card's items above everything else on the canvas"""
+        self.canvas.tag_raise(self.tag)
+
+    def clear(self):
+        """Remove card from canvas"""
+        self.canvas.delete(self.tag)
+        self.card_id = None
+        self.text_ids = []
+        self.face_ids = {}
 
 
 class ChipWidget:
@@ -295,40 +692,82 @@ class ChipWidget:
 
     # Image cache
     _chip_image_cache = {}
+    _rendered_chip_cache = {}  # Programmatic chips rasterized once at startup
+    _asset_manifest = frozenset()  # Filenames in assets/chips/, scanned once by preload()
 
     @classmethod
-    def _load_chip_image(cls, value: int):
+    def preload(cls):
+        """
+        Render the fallback chips and list the chip images to load.
+
+        Must be called once after the Tk root exists.
+
+        Returns:
+            List of (cache, cache_key, path) jobs for _prefetch_images()
+        """
+        chips_path = os.path.join(CardWidget._get_assets_path(), 'chips')
+        cls._asset_manifest = _scan_asset_dir(chips_path)
+
+        # Rasterize the fallback chip for every denomination once, so a stack
+        # is a handful of image items instead of two ovals per chip
+        for value in cls.CHIP_VALUES:
+            cls._rendered_chip_cache[value] = cls._render_chip(value)
+
+        jobs = []
+        for value in cls.CHIP_VALUES:
+            filename = _pick_image_file(f"chip_{value}", cls._asset_manifest)
+            if filename is not None:
+                jobs.append((cls._chip_image_cache, value, os.path.join(chips_path, filename)))
+        return jobs
+
+    @classmethod
+    def _render_chip(cls, value: int):
         """
-        Try to load a chip image from assets/chips/
+        Rasterize a chip (edge ring around a colored face) into a PhotoImage
 
         Args:
             value: The chip denomination (1, 5, 10, 25, 100)
 
         Returns:
-            PhotoImage object if found, None otherwise
+            PhotoImage of size CHIP_SIZE x CHIP_SIZE, transparent outside the chip
         """
-        cache_key = f"chip_{value}"
+        color = cls.CHIP_COLORS.get(value, '#888888')
+        edge_color = cls.CHIP_EDGE_COLORS.get(value, '#444444')
+
+        size = cls.CHIP_SIZE
+        center = (size - 1) / 2
+        outer_r = size / 2
+        inner_r = size / 2 - 4  # Matches the inset face plus its 2px outline
+
+        img = tk.PhotoImage(width=size, height=size)
+
+        # Fill one horizontal span per row for each circle; pixels never
+        # put stay transparent
+        for y in range(size):
+            dy = y - center
+            for radius, fill in ((outer_r, edge_color), (inner_r, color)):
+                if abs(dy) > radius:
+                    continue
+                half = (radius * radius - dy * dy) ** 0.5
+                x0 = max(0, int(round(center - half)))
+                x1 = min(size, int(round(center + half)) + 1)
+                if x1 > x0:
+                    img.put(fill, to=(x0, y, x1, y + 1))
+
+        return img
 
-        # Check cache first
-        if cache_key in cls._chip_image_cache:
-            return cls._chip_image_cache[cache_key]
-
-        # Try to load image
-        gui_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_path = os.path.join(gui_dir, 'assets')
-        chips_path = os.path.join(assets_path, 'chips')
-        image_path = os.path.join(chips_path, f"chip_{value}.png")
+    @classmethod
+    def _load_chip_image(cls, value: int):
+        """
+        Look up a preloaded chip image
 
-        if os.path.exists(image_path):
-            try:
-                img = tk.PhotoImage(file=image_path)
-                cls._chip_image_cache[cache_key] = img
-                return img
-            except Exception as e:
-                print(f"Warning: Failed to load chip image chip_{value}.png: {e}")
-                return None
+        Args:
+            value: The chip denomination (1, 5, 10, 25, 100)
 
-        return None
+        Returns:
+            PhotoImage object if found, None otherwise
+        """
+        return cls._chip_image_cache.get(value)
 
     def __init__(self, canvas, value: int, x: int, y: int, count: int = 1):
         self.canvas = canvas
@@ -337,14 +776,13 @@ class ChipWidget:
         self.y = y
         self.count = count  # Number of chips in this stack
         self.canvas_ids = []
+        self.count_text_id = None  # Count badge text, only shown above 5 chips
         self.image_ref = None
 
     def draw(self):
         """Draw the chip stack on the canvas"""
         # Clear previous drawing
-        for cid in self.canvas_ids:
-            self.canvas.delete(cid)
-        self.canvas_ids = []
+        self.clear()
 
         # Try to load image first
         self.image_ref = self._load_chip_image(self.value)
@@ -371,47 +809,62 @@ class ChipWidget:
                 fill='#FFFF00', outline='#000000', width=1
             )
             self.canvas_ids.append(text_bg)
-            text_id = self.canvas.create_text(
+            self.count_text_id = self.canvas.create_text(
                 self.x + self.CHIP_SIZE + 2, self.y,
-                text=str(self.count), font=('Arial', 9, 'bold'),
+                text=str(self.count), font=FONTS['badge9b'],
                 fill='#000000'
             )
-            self.canvas_ids.append(text_id)
+            self.canvas_ids.append(self.count_text_id)
+
+    def set_count(self, new_count: int):
+        """
+        Change the number of chips in this stack
+
+        The stack is only redrawn when its visible height or badge changes;
+        otherwise just the count badge text is updated.
+
+        Args:
+            new_count: New number of chips
+        """
+        old_count = self.count
+        if new_count == old_count:
+            return
+        self.count = new_count
+
+        if min(new_count, 5) == min(old_count, 5) and self.count_text_id:
+            self.canvas.itemconfigure(self.count_text_id, text=str(new_count))
+        else:
+            self.draw()
+
+    def move_to(self, x: int, y: int):
+        """Move the chip stack to a new position"""
+        dx = x - self.x
+        dy = y - self.y
+        self.x = x
+        self.y = y
+        if dx or dy:
+            for cid in self.canvas_ids:
+                self.canvas.move(cid, dx, dy)
 
     def _draw_programmatic(self):
-        """Draw chip using programmatic drawing"""
-        color = self.CHIP_COLORS.get(self.value, '#888888')
-        edge_color = self.CHIP_EDGE_COLORS.get(self.value, '#444444')
+        """Draw chip using the pre-rendered fallback image"""
+        chip_image = self._rendered_chip_cache.get(self.value)
 
         # Draw stacked chips (max 5 visual)
         for i in range(min(self.count, 5)):
             offset = i * 3
-
-            # Outer circle (edge)
-            outer = self.canvas.create_oval(
-                self.x - self.CHIP_SIZE // 2 + offset,
-                self.y - self.CHIP_SIZE // 2 + offset,
-                self.x + self.CHIP_SIZE // 2 + offset,
-                self.y + self.CHIP_SIZE // 2 + offset,
-                fill=edge_color, outline=edge_color, width=2
-            )
-            self.canvas_ids.append(outer)
-
-            # Inner circle (face)
-            inner = self.canvas.create_oval(
-                self.x - self.CHIP_SIZE // 2 + 3 + offset,
-                self.y - self.CHIP_SIZE // 2 + 3 + offset,
-                self.x + self.CHIP_SIZE // 2 - 3 + offset,
-                self.y + self.CHIP_SIZE // 2 - 3 + offset,
-                fill=color, outline=edge_color, width=2
+            cid = self.canvas.create_image(
+                self.x + offset,
+                self.y + offset,
+                image=chip_image
             )
-            self.canvas_ids.append(inner)
+            self.canvas_ids.append(cid)
 
         # Value text on top chip
         top_offset = min(self.count - 1, 4) * 3
         text_id = self.canvas.create_text(
             self.x + top_offset, self.y + top_offset,
-            text=str(self.value), font=('Arial', 10, 'bold'),
+            text=str(self.value), font=FONTS['label10b'],
             fill='#FFFFFF' if self.value == 100 else '#000000'
         )
         self.canvas_ids.append(text_id)
@@ -421,6 +874,27 @@ class ChipWidget:
         for cid in self.canvas_ids:
             self.canvas.delete(cid)
         self.canvas_ids = []
+        self.count_text_id = None
+
+
+@lru_cache(maxsize=256)
+def _chip_breakdown(pot_value: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Split a pot into chip stacks, largest denomination first (memoized)
+
+    Args:
+        pot_value: Total credits in the pot
+
+    Returns:
+        Tuple of (denomination, count) pairs, skipping empty denominations
+    """
+    stacks = []
+    remaining = pot_value
+    for value in ChipWidget.CHIP_VALUES:
+        count, remaining = divmod(remaining, value)
+        if count > 0:
+            stacks.append((value, count))
+    return tuple(stacks)
 
 
 class PotDisplay:
@@ -430,59 +904,83 @@ class PotDisplay:
         self.canvas = canvas
         self.x = x
         self.y = y
-        self.chip_widgets = []
+        self._chips: Dict[int, ChipWidget] = {}  # Denomination -> chip stack
         self.label_id = None
+        self._last_pot = None  # Pot value currently shown
+
+    def attach(self, canvas, x: int, y: int):
+        """
+        Move the display to another canvas or position
+
+        Args:
+            canvas: Canvas to draw on from now on
+            x, y: Center of the chip row
+        """
+        self.clear()
+        self.canvas = canvas
+        self.x = x
+        self.y = y
 
     def update(self, pot_value: int):
         """Update the pot display to show current value"""
-        # Clear existing chips
-        for chip in self.chip_widgets:
-            chip.clear()
-        self.chip_widgets = []
-
-        if self.label_id:
-            self.canvas.delete(self.label_id)
+        # Most refreshes don't touch the pot
+        if pot_value == self._last_pot:
+            return
+        self._last_pot = pot_value
 
         if pot_value == 0:
+            self._clear_chips()
+
             # Show "Pot: 0" text
-            self.label_id = self.canvas.create_text(
-                self.x, self.y,
-                text="Pot: 0", font=('Arial', 14, 'bold'),
-                fill='#FFFF00'
-            )
+            self._set_label(self.x, self.y, "Pot: 0", FONTS['pot14b'])
             return
 
         # Calculate chip breakdown
-        remaining = pot_value
-        chip_counts = {}
-
-        for value in ChipWidget.CHIP_VALUES:
-            count = remaining // value
-            if count > 0:
-                chip_counts[value] = count
-                remaining -= count * value
+        chip_counts = dict(_chip_breakdown(pot_value))
 
-        # Position chips in a nice layout
+        # Position chips in a nice layout, reusing the stacks already on the table
         chip_x = self.x - 40
         for value in ChipWidget.CHIP_VALUES:
+            chip = self._chips.get(value)
             if value in chip_counts:
-                chip = ChipWidget(self.canvas, value, chip_x, self.y, chip_counts[value])
-                chip.draw()
-                self.chip_widgets.append(chip)
+                if chip is None:
+                    chip = ChipWidget(self.canvas, value, chip_x, self.y, chip_counts[value])
+                    chip.draw()
+                    self._chips[value] = chip
+                else:
+                    chip.move_to(chip_x, self.y)
+                    chip.set_count(chip_counts[value])
                 chip_x += 45
+            elif chip is not None:
+                # This denomination dropped out of the breakdown
+                chip.clear()
+                del self._chips[value]
 
         # Add pot total label
-        self.label_id = self.canvas.create_text(
-            self.x, self.y - 35,
-            text=f"Pot: {pot_value}", font=('Arial', 12, 'bold'),
-            fill='#FFFF00'
-        )
+        self._set_label(self.x, self.y - 35, f"Pot: {pot_value}", FONTS['title12b'])
+
+    def _set_label(self, x: int, y: int, text: str, font):
+        """Create the pot label once, then just retext and reposition it"""
+        if self.label_id:
+            self.canvas.coords(self.label_id, x, y)
+            self.canvas.itemconfigure(self.label_id, text=text, font=font)
+        else:
+            self.label_id = self.canvas.create_text(
+                x, y,
+                text=text, font=font,
+                fill='#FFFF00'
+            )
+
+    def _clear_chips(self):
+        """Remove every chip stack"""
+        for chip in self._chips.values():
+            chip.clear()
+        self._chips = {}
 
     def clear(self):
         """Clear the entire pot display"""
-        for chip in self.chip_widgets:
-            chip.clear()
-        self.chip_widgets = []
+        self._last_pot = None
+        self._clear_chips()
         if self.label_id:
             self.canvas.delete(self.label_id)
             self.label_id = None
@@ -499,16 +997,75 @@ class SabaccGUI:
 
         # Game state
         self.game: Optional[GameState] = None
-        self.card_widgets: List[CardWidget] = []
+        self._card_index: Dict[Tuple[object, int], CardWidget] = {}  # Slot -> widget on the table
+        self._live_slots = set()
+        self._card_pool: List[CardWidget] = []  # Hidden widgets waiting to be reused
+        self._hidden_groups = set()  # Group tags of folded opponents' hands
+        self._chrome_ids = {}  # Chrome key -> canvas item id (labels, badges, placeholders)
+        self._chrome_state = {}  # Chrome key -> (coords, options) last applied
+        self._hidden_chrome = set()  # Chrome keys currently hidden
+        self._drawing = False  # True while inside _batch_draw()
+        self._layout_xy: Dict[tuple, Tuple[int, int]] = {}  # Slot -> canvas position
+        self._redraw_pending = False  # An idle redraw is already scheduled
+        self._dirty = False  # The table or buttons need a refresh
+        self._last_btn_state = None  # Inputs of the last update_buttons() call
+        self._turn_state = None  # (text, color) currently on the turn indicator
+        self._last_info = None  # (credits, hand, pot, current bet) shown in the info panel
+        self._last_state_key = None  # _display_state_key() of the last update_display()
+        self._dialog_pool: Dict[str, tk.Toplevel] = {}  # Dialog kind -> withdrawn window for reuse
+        self._toast: Optional[tk.Toplevel] = None  # Reusable notice window for show_toast()
+        self._toast_after = None  # Pending after() id that hides the notice
+        self._ui_queue = queue.Queue()  # Callables posted by the AI worker, run on the Tk thread
+        self._ai_thread: Optional[threading.Thread] = None  # AI worker while it owns the game state
+        self._playable_cache = (None, [])  # (hand contents, playable Trionfi) from the last lookup
         self.pot_display: Optional[PotDisplay] = None
         self.current_player_action = {}  # Accumulate actions during turn
         self.waiting_for_input = False
         self.input_type = None  # 'draw_source', 'discard_index', etc.
         self.current_phase = 'flop'  # 'flop', 'turn', 'river', 'showdown'
 
-        # Setup UI
-        self.setup_menu()
+        # Trionfi number -> GUI handler for effects that need their own dialogs
+        self._trionfi_dispatch = {
+            4: self.play_emperor_effect,             # The Emperor
+            5: self.play_hierophant_effect,          # The Hierophant
+            9: self.play_hermit_effect,              # The Hermit
+            10: self.play_wheel_of_fortune_effect,   # Wheel of Fortune
+            18: self.play_moon_effect,               # The Moon
+            19: self.play_sun_effect,                # The Sun
+            20: self.play_judgment_effect,           # The Last Judgment
+            21: self.play_universe_effect,           # The Universe
+        }
+
+        # Shared fonts, resolved by Tk once
+        self._fonts = _create_fonts()
+
+        # Card values and fallback chips are ready immediately; image files are
+        # read in the background and swapped in once they have all arrived
+        image_jobs = CardWidget.preload() + ChipWidget.preload()
+        _prefetch_images(self.root, image_jobs, self._on_images_loaded)
+
+        # Log lines are buffered and written in one go when the event loop is idle
+        # (the log widget itself is built in _setup_deferred())
+        self.log_text = None
+        self._log_buffer: List[str] = []
+        self._log_pending = False
+
+        # Setup UI - only the table is needed for the first frame, the rest
+        # is built once the event loop is idle
         self.setup_canvas()
+        self.root.after_idle(self._setup_deferred)
+
+    def _on_images_loaded(self):
+        """Redraw anything that was drawn with fallback graphics before the images arrived"""
+        if not self.game:
+            return
+        self._clear_cards()
+        self.pot_display.clear()
+        self.request_redraw()
+
+    def _setup_deferred(self):
+        """Build the non-critical parts of the window, then start the game"""
+        self.setup_menu()
         self.setup_info_panel()
         self.setup_buttons()
         self.setup_log()
@@ -543,6 +1100,37 @@ class SabaccGUI:
             bg='#008000'  # Green felt
         )
         self.canvas.pack(pady=5)
+        self._draw_table_background()
+
+        # The pot sits in the center of the table, below the community cards
+        if self.pot_display:
+            self.pot_display.attach(self.canvas, *POT_XY)
+        else:
+            self.pot_display = PotDisplay(self.canvas, *POT_XY)
+
+    def _draw_table_background(self):
+        """
+        Draw the parts of the table that never change, once
+
+        The felt is the canvas background color and the pile titles are plain
+        text, so they're created a single time under the 'background' tag and
+        kept below everything else rather than being touched on every update.
+        """
+        discard_x, discard_y = DISCARD_XY
+        draw_pile_x, draw_pile_y = DRAW_PILE_XY
+        community_x, community_y = COMMUNITY_XY
+
+        for x, y, text in ((discard_x + 35, discard_y - 30, "Discard Pile"),
+                           (draw_pile_x + 35, draw_pile_y - 30, "Draw Pile"),
+                           (community_x, community_y - 30, "Community Cards")):
+            self.canvas.create_text(
+                x, y,
+                text=text,
+                font=self._fonts['title12b'],
+                fill='white',
+                tags='background'
+            )
+        self.canvas.tag_lower('background')
 
     def setup_info_panel(self):
         """Create info panel showing game state"""
@@ -553,17 +1141,19 @@ class SabaccGUI:
         left_frame = tk.Frame(info_frame)
         left_frame.pack(side=tk.LEFT, padx=10)
 
+        self._credits_var = tk.StringVar(value="Credits: 0")
         self.credits_label = tk.Label(
             left_frame,
-            text="Credits: 0",
-            font=('Arial', 12, 'bold')
+            textvariable=self._credits_var,
+            font=self._fonts['title12b']
         )
         self.credits_label.pack(side=tk.LEFT, padx=10)
 
+        self._hand_value_var = tk.StringVar(value="Hand Value: 0")
         self.hand_value_label = tk.Label(
             left_frame,
-            text="Hand Value: 0",
-            font=('Arial', 12)
+            textvariable=self._hand_value_var,
+            font=self._fonts['label12']
         )
         self.hand_value_label.pack(side=tk.LEFT, padx=10)
 
@@ -574,7 +1164,7 @@ class SabaccGUI:
         self.turn_indicator = tk.Label(
             center_frame,
             text="Your Turn",
-            font=('Arial', 12, 'bold'),
+            font=self._fonts['title12b'],
             bg='#90EE90',  # Light green
             fg='black',
             padx=15,
@@ -588,17 +1178,19 @@ class SabaccGUI:
         right_frame = tk.Frame(info_frame)
         right_frame.pack(side=tk.RIGHT, padx=10)
 
+        self._pot_var = tk.StringVar(value="Pot: 0")
         self.pot_label = tk.Label(
             right_frame,
-            text="Pot: 0",
-            font=('Arial', 12, 'bold')
+            textvariable=self._pot_var,
+            font=self._fonts['title12b']
         )
         self.pot_label.pack(side=tk.LEFT, padx=10)
 
+        self._current_bet_var = tk.StringVar(value="Current Bet: 0")
         self.current_bet_label = tk.Label(
             right_frame,
-            text="Current Bet: 0",
-            font=('Arial', 12)
+            textvariable=self._current_bet_var,
+            font=self._fonts['label12']
         )
         self.current_bet_label.pack(side=tk.LEFT, padx=10)
 
@@ -692,6 +1284,9 @@ class SabaccGUI:
         self.log_text.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.log_text.yview)
 
+        # Show anything logged before the widget existed
+        self._flush_log()
+
     def update_buttons(self):
         """Enable/disable buttons based on current game state"""
         if not self.game:
@@ -699,8 +1294,25 @@ class SabaccGUI:
 
         player = self.game.players[0]
 
+        # Check if it's player's turn and they haven't acted yet
+        is_players_turn = not player.has_folded and not player.has_acted
+        has_bet = 'bet_action' in self.current_player_action
+        amount_to_call = self.game.current_bet - player.current_bet
+        can_play_special = (is_players_turn and has_bet and not player.is_hermit
+                            and bool(self._playable_trionfi(player)))
+
+        # Skip all the button config calls if nothing they depend on has changed
+        key = (player.is_hermit, is_players_turn, self.waiting_for_input, has_bet,
+               amount_to_call, player.credits > amount_to_call, player.has_drawn,
+               len(player.hand) > 0, can_play_special)
+        if key == self._last_btn_state:
+            if player.is_hermit or (is_players_turn and not self.waiting_for_input):
+                self.set_turn_player()
+            return
+        self._last_btn_state = key
+
         # Check if player is in hermit mode - disable all actions
-        if getattr(player, 'is_hermit', False):
+        if player.is_hermit:
             self.fold_btn.config(state=tk.DISABLED)
             self.call_btn.config(state=tk.DISABLED)
             self.raise_btn.config(state=tk.DISABLED)
@@ -711,45 +1323,40 @@ class SabaccGUI:
             self.set_turn_player()  # Shows "Hermit Mode"
             return
 
-        # Check if it's player's turn and they haven't acted yet
-        is_players_turn = not player.has_folded and not player.has_acted
-
         if is_players_turn and not self.waiting_for_input:
             # Betting buttons
             self.fold_btn.config(state=tk.NORMAL)
 
-            amount_to_call = self.game.current_bet - player.current_bet
             if amount_to_call > 0:
                 self.call_btn.config(text=f"Call {amount_to_call}", state=tk.NORMAL)
             else:
                 self.call_btn.config(text="Check", state=tk.NORMAL)
 
-            if player.credits > self.game.current_bet - player.current_bet:
+            if player.credits > amount_to_call:
                 self.raise_btn.config(state=tk.NORMAL)
             else:
                 self.raise_btn.config(state=tk.DISABLED)
 
             # Draw button (only if haven't drawn yet)
-            if not player.has_drawn and 'bet_action' in self.current_player_action:
+            if not player.has_drawn and has_bet:
                 self.draw_btn.config(state=tk.NORMAL)
             else:
                 self.draw_btn.config(state=tk.DISABLED)
 
             # Discard button (only if have cards and have drawn or bet)
-            if len(player.hand) > 0 and 'bet_action' in self.current_player_action:
+            if len(player.hand) > 0 and has_bet:
                 self.discard_btn.config(state=tk.NORMAL)
             else:
                 self.discard_btn.config(state=tk.DISABLED)
 
             # End Turn button (only if have placed a bet)
-            if 'bet_action' in self.current_player_action:
+            if has_bet:
                 self.end_turn_btn.config(state=tk.NORMAL)
             else:
                 self.end_turn_btn.config(state=tk.DISABLED)
 
             # Special card button
-            playable = get_playable_trionfi(player)
-            if playable and 'bet_action' in self.current_player_action:
+            if can_play_special:
                 self.special_btn.config(state=tk.NORMAL)
             else:
                 self.special_btn.config(state=tk.DISABLED)
@@ -766,10 +1373,44 @@ class SabaccGUI:
             self.end_turn_btn.config(state=tk.DISABLED)
             self.special_btn.config(state=tk.DISABLED)
 
-    def log(self, message: str):
-        """Add message to game log"""
+    def log(self, message: str, *args):
+        """
+        Add message to game log (written out on the next idle flush)
+
+        Args:
+            message: Log line, or a %-style format string when args are given
+            *args: Immutable values for the format string; formatting is
+                   deferred until the line is actually written
+        """
+        self._log_buffer.append((message, args) if args else message)
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def log_many(self, lines: List[str]):
+        """
+        Add several messages to the game log at once
+
+        Args:
+            lines: Log lines, written out together on the next flush
+        """
+        self._log_buffer.extend(lines)
+        if not self._log_pending:
+            self._log_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Write all buffered log lines with a single insert and scroll"""
+        self._log_pending = False
+        if self.log_text is None or not self._log_buffer:
+            return
+
+        text = "\n".join(line if isinstance(line, str) else line[0] % line[1]
+                         for line in self._log_buffer) + "\n"
+        self._log_buffer = []
+
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.insert(tk.END, text)
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
@@ -811,6 +1452,7 @@ class SabaccGUI:
         """Start a new hand"""
         self.game.start_new_hand()
         self.current_phase = 'flop'
+        self._build_layout(len(self.game.players))
         self.log(f"\n=== HAND #{self.game.hand_number} ===")
         self.log(f"Dealer: {self.game.players[self.game.dealer_index].name}")
 
@@ -834,207 +1476,430 @@ class SabaccGUI:
         self.log("\nYour turn! Place your bet.")
 
     def update_display(self):
-        """Update the entire display"""
-        # Clear canvas
-        self.canvas.delete("all")
-        self.card_widgets = []
+        """Update the display, only touching canvas items that changed"""
+        if self._ai_thread is not None:
+            # Don't read the game while the AI worker is changing it
+            self._dirty = True
+            return
+
+        # Nothing on the table or in the info panel changed since the last pass
+        state_key = self._display_state_key()
+        if state_key is not None and state_key == self._last_state_key:
+            return
+        self._last_state_key = state_key
+
+        with self._batch_draw():
+            self._update_display()
 
+    def _display_state_key(self):
+        """
+        Summarize everything update_display() shows
+
+        Returns:
+            Tuple that changes whenever the table would look different, or
+            None when there is no game
+        """
+        game = self.game
+        if not game:
+            return None
+
+        player = game.players[0]
+        return (
+            id(game),
+            game.hands_face_up,
+            tuple((p.name, p.credits, p.has_folded, tuple(p.hand)) for p in game.players[1:]),
+            len(game.discard_pile),
+            game.discard_pile[-1] if game.discard_pile else None,
+            len(game.draw_pile.cards),
+            tuple(game.community_cards),
+            game.pot,
+            game.current_bet,
+            tuple(player.hand),
+            player.credits,
+        )
+
+    @contextmanager
+    def _batch_draw(self):
+        """
+        Group canvas and label changes so Tk redraws them once
+
+        Nested batches are folded into the outermost one, which flushes
+        pending idle work (geometry and redraws) exactly once on exit.
+        """
+        if self._drawing:
+            yield
+            return
+
+        self._drawing = True
+        try:
+            yield
+        finally:
+            self._drawing = False
+            self.root.update_idletasks()
+
+    def _update_display(self):
+        """Apply the current game state to the canvas (called inside _batch_draw)"""
+        # Card widgets are diffed by slot and labels/badges/placeholders by key;
+        # anything not touched during this pass is hidden at the end
         if not self.game:
+            self._clear_cards()
+            self._hide_stale_chrome(set())
             return
 
+        self._live_slots = set()
+        live_chrome = set()
+
+        # Show face up if hands_face_up flag is set
+        face_up = self.game.hands_face_up
+
         # Draw opponent hands (card backs)
-        opponent_y = 20
         for i, player in enumerate(self.game.players[1:], 1):
+            group = f'player_{i}'
+
             if player.has_folded:
+                # Hide the whole hand with one call and keep its cards for the next hand
+                if group not in self._hidden_groups:
+                    self.canvas.itemconfigure(group, state='hidden')
+                    self._hidden_groups.add(group)
+                self._live_slots.update(slot for slot in self._card_index if slot[0] == i)
                 continue
 
-            opponent_x = 50 + (i - 1) * 250
+            if group in self._hidden_groups:
+                self.canvas.itemconfigure(group, state='normal')
+                self._hidden_groups.discard(group)
 
             # Player name and info
-            self.canvas.create_text(
-                opponent_x, opponent_y,
-                text=f"{player.name}\nCredits: {player.credits}",
-                anchor=tk.NW,
-                font=('Arial', 10, 'bold')
-            )
+            self._chrome(live_chrome, ('name', i), 'text', self._slot_xy(('name', i)),
+                         text=f"{player.name}\nCredits: {player.credits}",
+                         anchor=tk.NW,
+                         font=self._fonts['label10b'])
 
             # Draw card backs
+            row = []
+            restack = False
             for j in range(len(player.hand)):
-                card_x = opponent_x + j * 20
-                card_y = opponent_y + 30
-
-                # Show face up if hands_face_up flag is set
-                face_up = getattr(self.game, 'hands_face_up', False)
-
-                card_widget = CardWidget(
-                    self.canvas,
+                card_widget, redrawn = self._place_card(
+                    (i, j),
                     player.hand[j] if face_up else ('?', '?'),
-                    card_x, card_y,
                     face_up=face_up,
-                    clickable=False
+                    group=group
                 )
-                self.card_widgets.append(card_widget)
+                row.append(card_widget)
+                restack = restack or redrawn
+
+            # Opponent cards overlap, so a redrawn card must not cover its right-hand neighbours
+            if restack:
+                for card_widget in row:
+                    card_widget.raise_to_top()
 
         # Draw discard pile (left side)
-        discard_x = 50
-        discard_y = 200
-
-        self.canvas.create_text(
-            discard_x + 35, discard_y - 30,
-            text="Discard Pile",
-            font=('Arial', 12, 'bold'),
-            fill='white'
-        )
+        discard_x, discard_y = DISCARD_XY
 
         if self.game.discard_pile:
             # Show top card of discard pile
             top_card = self.game.discard_pile[-1]
-            discard_widget = CardWidget(
-                self.canvas,
+            self._place_card(
+                ('discard', 0),
                 top_card,
-                discard_x, discard_y,
                 face_up=True,
                 clickable=True,
                 on_click_callback=self.show_discard_pile
             )
-            self.card_widgets.append(discard_widget)
 
             # Show card count badge
             count = len(self.game.discard_pile)
             if count > 1:
-                self.canvas.create_oval(
-                    discard_x + 50, discard_y + 70,
-                    discard_x + 75, discard_y + 95,
-                    fill='#CC0000', outline='white', width=2
-                )
-                self.canvas.create_text(
-                    discard_x + 62, discard_y + 82,
-                    text=str(count), font=('Arial', 11, 'bold'),
-                    fill='white'
-                )
+                self._chrome(live_chrome, 'discard_badge', 'oval',
+                             (discard_x + 50, discard_y + 70, discard_x + 75, discard_y + 95),
+                             fill='#CC0000', outline='white', width=2)
+                self._chrome(live_chrome, 'discard_count', 'text', (discard_x + 62, discard_y + 82),
+                             text=str(count), font=self._fonts['pip11b'],
+                             fill='white')
         else:
             # Empty pile placeholder
-            self.canvas.create_rectangle(
-                discard_x, discard_y,
-                discard_x + CardWidget.CARD_WIDTH, discard_y + CardWidget.CARD_HEIGHT,
-                fill='#006400', outline='white', width=2, dash=(4, 4)
-            )
-            self.canvas.create_text(
-                discard_x + CardWidget.CARD_WIDTH // 2, discard_y + CardWidget.CARD_HEIGHT // 2,
-                text="Empty", font=('Arial', 10),
-                fill='white'
-            )
+            self._chrome(live_chrome, 'discard_empty', 'rectangle',
+                         (discard_x, discard_y,
+                          discard_x + CardWidget.CARD_WIDTH, discard_y + CardWidget.CARD_HEIGHT),
+                         fill='#006400', outline='white', width=2, dash=(4, 4))
+            self._chrome(live_chrome, 'discard_empty_text', 'text',
+                         (discard_x + CardWidget.CARD_WIDTH // 2, discard_y + CardWidget.CARD_HEIGHT // 2),
+                         text="Empty", font=self._fonts['label10'],
+                         fill='white')
 
         # Draw draw pile indicator (next to discard)
-        draw_pile_x = 140
-        draw_pile_y = 200
-
-        self.canvas.create_text(
-            draw_pile_x + 35, draw_pile_y - 30,
-            text="Draw Pile",
-            font=('Arial', 12, 'bold'),
-            fill='white'
-        )
+        draw_pile_x, draw_pile_y = DRAW_PILE_XY
 
         # Draw a face-down card to represent draw pile
         if self.game.draw_pile.cards:
-            draw_pile_widget = CardWidget(
-                self.canvas,
+            self._place_card(
+                ('draw', 0),
                 ('?', '?'),
-                draw_pile_x, draw_pile_y,
-                face_up=False,
-                clickable=False
+                face_up=False
             )
-            self.card_widgets.append(draw_pile_widget)
 
             # Show remaining count
             remaining = len(self.game.draw_pile.cards)
-            self.canvas.create_oval(
-                draw_pile_x + 50, draw_pile_y + 70,
-                draw_pile_x + 75, draw_pile_y + 95,
-                fill='#0066CC', outline='white', width=2
-            )
-            self.canvas.create_text(
-                draw_pile_x + 62, draw_pile_y + 82,
-                text=str(remaining), font=('Arial', 11, 'bold'),
-                fill='white'
-            )
+            self._chrome(live_chrome, 'draw_badge', 'oval',
+                         (draw_pile_x + 50, draw_pile_y + 70, draw_pile_x + 75, draw_pile_y + 95),
+                         fill='#0066CC', outline='white', width=2)
+            self._chrome(live_chrome, 'draw_count', 'text', (draw_pile_x + 62, draw_pile_y + 82),
+                         text=str(remaining), font=self._fonts['pip11b'],
+                         fill='white')
 
         # Draw community cards
-        community_y = 200
-        community_x_start = 400
-
-        self.canvas.create_text(
-            community_x_start, community_y - 30,
-            text="Community Cards",
-            font=('Arial', 12, 'bold'),
-            fill='white'
-        )
-
         for i, card in enumerate(self.game.community_cards):
-            card_x = community_x_start + i * 80
-            card_widget = CardWidget(
-                self.canvas,
+            self._place_card(
+                ('community', i),
                 card,
-                card_x, community_y,
-                face_up=True,
-                clickable=False
+                face_up=True
             )
-            self.card_widgets.append(card_widget)
 
         # Draw pot display (center of table, below community cards)
-        pot_x = 500
-        pot_y = 320
-        if not self.pot_display:
-            self.pot_display = PotDisplay(self.canvas, pot_x, pot_y)
-        else:
-            # Reassign canvas in case it was cleared
-            self.pot_display.canvas = self.canvas
-            self.pot_display.x = pot_x
-            self.pot_display.y = pot_y
         self.pot_display.update(self.game.pot)
 
         # Draw player's hand (at bottom)
         player = self.game.players[0]
-        player_y = 380
-        player_x_start = 300
 
         for i, card in enumerate(player.hand):
-            card_x = player_x_start + i * 80
-            card_widget = CardWidget(
-                self.canvas,
+            self._place_card(
+                (0, i),
                 card,
-                card_x, player_y,
                 face_up=True,
                 clickable=True
             )
-            self.card_widgets.append(card_widget)
+
+        # Hide cards whose slots are no longer on the table and keep them for reuse
+        for slot in [slot for slot in self._card_index if slot not in self._live_slots]:
+            card_widget = self._card_index.pop(slot)
+            card_widget.hide()
+            card_widget.set_group(None)  # So showing the old group can't reveal it
+            self._card_pool.append(card_widget)
+
+        # Hide labels and badges that weren't needed this time, keep the rest above the cards
+        self._hide_stale_chrome(live_chrome)
+        self.canvas.tag_raise('chrome')
 
         # Update info labels
         self.update_info_labels()
 
+        # Write pending log lines in the same pass as the table
+        self._flush_log()
+
+    def _chrome(self, live: set, key, kind: str, coords: tuple, **options):
+        """
+        Show a label, badge or placeholder, creating its canvas item only once
+
+        Later calls move and reconfigure the existing item, and skip the Tk
+        calls entirely when nothing about it has changed.
+
+        Args:
+            live: Keys shown during the current update (key is added to it)
+            key: Stable name for the item, e.g. 'draw_count' or ('name', 2)
+            kind: Canvas item type ('text', 'oval' or 'rectangle')
+            coords: Item coordinates
+            **options: Item options such as text, fill or font
+        """
+        live.add(key)
+        item_id = self._chrome_ids.get(key)
+
+        if item_id is None:
+            create = getattr(self.canvas, f'create_{kind}')
+            self._chrome_ids[key] = create(*coords, tags='chrome', **options)
+            self._chrome_state[key] = (coords, options)
+            return
+
+        if key in self._hidden_chrome:
+            self.canvas.itemconfigure(item_id, state='normal')
+            self._hidden_chrome.discard(key)
+
+        last_coords, last_options = self._chrome_state[key]
+        if coords != last_coords:
+            self.canvas.coords(item_id, *coords)
+        if options != last_options:
+            self.canvas.itemconfigure(item_id, **options)
+        self._chrome_state[key] = (coords, options)
+
+    def _hide_stale_chrome(self, live: set):
+        """Hide every chrome item whose key wasn't shown during the current update"""
+        for key, item_id in self._chrome_ids.items():
+            if key not in live and key not in self._hidden_chrome:
+                self.canvas.itemconfigure(item_id, state='hidden')
+                self._hidden_chrome.add(key)
+
+    def request_redraw(self):
+        """
+        Schedule a display and button refresh for when the event loop goes idle.
+
+        Several state changes in a row (bet, then draw, then discard) only
+        cost a single update_display() + update_buttons() this way.
+        """
+        self._dirty = True
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._maybe_redraw)
+
+    def _maybe_redraw(self):
+        """Run the redraw scheduled by request_redraw(), unless a display pass is in progress"""
+        self._redraw_pending = False
+        if not self._dirty:
+            return
+        if self._ai_thread is not None:
+            # The AI worker owns the game state; _finish_ai_turns() redraws
+            return
+        if self._drawing:
+            # Try again once the current pass has finished
+            self.request_redraw()
+            return
+
+        self._dirty = False
+        self.update_display()
+        self.update_buttons()
+
+    def _build_layout(self, num_players: int):
+        """
+        Precompute canvas positions for the usual table slots
+
+        Args:
+            num_players: Number of players at the table
+        """
+        self._layout_xy = {}
+        for index in range(LAYOUT_HAND_SLOTS):
+            for owner in range(num_players):
+                self._slot_xy((owner, index))
+            self._slot_xy(('community', index))
+        for owner in range(1, num_players):
+            self._slot_xy(('name', owner))
+        self._slot_xy(('discard', 0))
+        self._slot_xy(('draw', 0))
+
+    def _slot_xy(self, slot) -> Tuple[int, int]:
+        """
+        Get the top-left canvas position of a table slot
+
+        Args:
+            slot: (player_index, hand_slot), ('community', index), ('name', player_index),
+                  ('discard', 0) or ('draw', 0)
+
+        Returns:
+            (x, y) position, computed on first use and cached
+        """
+        xy = self._layout_xy.get(slot)
+        if xy is not None:
+            return xy
+
+        owner, index = slot
+        if owner == 'community':
+            xy = (COMMUNITY_XY[0] + index * CARD_SPACING, COMMUNITY_XY[1])
+        elif owner == 'discard':
+            xy = DISCARD_XY
+        elif owner == 'draw':
+            xy = DRAW_PILE_XY
+        elif owner == 'name':
+            xy = (OPPONENT_X + (index - 1) * OPPONENT_SPACING, OPPONENT_Y)
+        elif owner == 0:
+            xy = (PLAYER_HAND_XY[0] + index * CARD_SPACING, PLAYER_HAND_XY[1])
+        else:
+            xy = (OPPONENT_X + (owner - 1) * OPPONENT_SPACING + index * OPPONENT_CARD_SPACING,
+                  OPPONENT_Y + OPPONENT_CARD_OFFSET)
+
+        self._layout_xy[slot] = xy
+        return xy
+
+    def _place_card(self, slot, card: Card, face_up: bool = True,
+                    clickable: bool = False, on_click_callback=None,
+                    group: Optional[str] = None):
+        """
+        Show a card in a table slot, reusing the widget already in that slot
+
+        Args:
+            slot: Slot key, (player_index, hand_slot) or (pile_name, index)
+            card: The card tuple (rank, suit) to show
+            face_up: Whether the card is shown face up
+            clickable: Whether clicking the card toggles selection
+            on_click_callback: Optional callback for clicks
+            group: Group tag shared by the cards of one opponent's hand
+
+        Returns:
+            Tuple of (card_widget, redrawn) where redrawn is True if the slot's
+            canvas items are new or came from the pool
+        """
+        self._live_slots.add(slot)
+        card_widget = self._card_index.get(slot)
+
+        if card_widget is None:
+            x, y = self._slot_xy(slot)
+            card_widget = self._acquire_card(card, x, y, face_up, clickable, on_click_callback)
+            card_widget.set_group(group)
+            self._card_index[slot] = card_widget
+            return card_widget, True
+
+        # Slot positions never change, so a widget already in its slot only
+        # needs its card data updated
+        return card_widget, card_widget.set_card(card, face_up)
+
+    def _acquire_card(self, card: Card, x: int, y: int, face_up: bool,
+                      clickable: bool, on_click_callback) -> CardWidget:
+        """Take a widget from the pool (or create one if it's empty) and point it at a card"""
+        if self._card_pool:
+            card_widget = self._card_pool.pop()
+            card_widget.retarget(card, x, y, face_up=face_up, clickable=clickable,
+                                 on_click_callback=on_click_callback)
+            return card_widget
+
+        return CardWidget(
+            self.canvas,
+            card,
+            x, y,
+            face_up=face_up,
+            clickable=clickable,
+            on_click_callback=on_click_callback
+        )
+
+    def _clear_cards(self):
+        """Remove every card widget from the table, pooled ones included"""
+        for card_widget in self._card_index.values():
+            card_widget.clear()
+        for card_widget in self._card_pool:
+            card_widget.clear()
+        self._card_index = {}
+        self._card_pool = []
+        self._hidden_groups = set()
+        self._last_state_key = None  # Whatever comes next has to be drawn from scratch
+
     def update_info_labels(self):
         """Update the info panel labels"""
         if not self.game:
             return
 
         player = self.game.players[0]
-        value, busted = calculate_hand_value(player.hand)
-        status = " (BUSTED)" if busted else ""
 
-        self.credits_label.config(text=f"Credits: {player.credits}")
-        self.hand_value_label.config(text=f"Hand Value: {value}{status}")
-        self.pot_label.config(text=f"Pot: {self.game.pot}")
-        self.current_bet_label.config(text=f"Current Bet: {self.game.current_bet}")
+        # Only touch the labels whose inputs changed since last time
+        hand = tuple(player.hand)
+        last_credits, last_hand, last_pot, last_bet = self._last_info or (None, None, None, None)
+        self._last_info = (player.credits, hand, self.game.pot, self.game.current_bet)
+
+        if player.credits != last_credits:
+            self._credits_var.set(f"Credits: {player.credits}")
+        if hand != last_hand:
+            value, busted = _hand_value(player.hand)
+            status = " (BUSTED)" if busted else ""
+            self._hand_value_var.set(f"Hand Value: {value}{status}")
+        if self.game.pot != last_pot:
+            self._pot_var.set(f"Pot: {self.game.pot}")
+        if self.game.current_bet != last_bet:
+            self._current_bet_var.set(f"Current Bet: {self.game.current_bet}")
 
     def update_turn_indicator(self, text: str, color: str):
         """Update the turn indicator with text and background color"""
+        if (text, color) == self._turn_state:
+            return
+        self._turn_state = (text, color)
         self.turn_indicator.config(text=text, bg=color)
 
     def set_turn_player(self):
         """Set indicator to show it's the player's turn"""
         player = self.game.players[0]
-        if getattr(player, 'is_hermit', False):
+        if player.is_hermit:
             self.update_turn_indicator("Hermit Mode", '#DDA0DD')  # Plum
         elif player.has_folded:
             self.update_turn_indicator("Folded", '#D3D3D3')  # Light gray
@@ -1049,24 +1914,96 @@ class SabaccGUI:
         """Set indicator to waiting state"""
         self.update_turn_indicator(text, '#D3D3D3')  # Light gray
 
+    def _open_dialog(self, kind: str, title: str, geometry: str) -> tk.Toplevel:
+        """
+        Get an empty dialog window, reusing the one left over from the last dialog of this kind
+
+        Creating a Toplevel costs a window manager round-trip, so closed dialogs
+        are only withdrawn and their contents rebuilt the next time.
+
+        Args:
+            kind: Dialog kind, one window is kept per kind (e.g. 'draw', 'discard')
+            title: Window title
+            geometry: Window size, e.g. "300x200"
+
+        Returns:
+            The dialog window, shown and empty
+        """
+        dialog = self._dialog_pool.get(kind)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = tk.Toplevel(self.root)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self._close_dialog(dialog))
+            self._dialog_pool[kind] = dialog
+        else:
+            for child in dialog.winfo_children():
+                child.destroy()
+            dialog.deiconify()
+
+        dialog.title(title)
+        dialog.geometry(geometry)
+        return dialog
+
+    def _close_dialog(self, dialog: tk.Toplevel):
+        """Hide a dialog from _open_dialog() so it can be reused"""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def show_toast(self, title: str, message: str, ms: int = TOAST_MS):
+        """
+        Show a short notice that goes away by itself, without blocking the game
+
+        One borderless window is reused for every notice; a new notice
+        replaces the one currently showing.
+
+        Args:
+            title: Bold first line
+            message: Notice text
+            ms: How long to keep it up
+        """
+        toast = self._toast
+        if toast is None or not toast.winfo_exists():
+            toast = tk.Toplevel(self.root, relief=tk.RAISED, borderwidth=2)
+            toast.overrideredirect(True)
+            toast.transient(self.root)
+            self._toast_title = tk.Label(toast, font=self._fonts['label10b'])
+            self._toast_title.pack(padx=15, pady=(10, 0))
+            self._toast_text = tk.Label(toast, justify=tk.LEFT)
+            self._toast_text.pack(padx=15, pady=10)
+            self._toast = toast
+        else:
+            toast.deiconify()
+
+        self._toast_title.config(text=title)
+        self._toast_text.config(text=message)
+        toast.geometry(f"+{self.root.winfo_rootx() + 40}+{self.root.winfo_rooty() + 60}")
+        toast.lift()
+
+        if self._toast_after:
+            self.root.after_cancel(self._toast_after)
+        self._toast_after = self.root.after(ms, self._hide_toast)
+
+    def _hide_toast(self):
+        """Take the notice from show_toast() down"""
+        self._toast_after = None
+        if self._toast is not None and self._toast.winfo_exists():
+            self._toast.withdraw()
+
     def show_discard_pile(self, clicked_card=None):
         """Show a dialog with all cards in the discard pile"""
         if not self.game.discard_pile:
             messagebox.showinfo("Discard Pile", "The discard pile is empty.")
             return
 
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Discard Pile")
-        dialog.geometry("500x400")
+        dialog = self._open_dialog('discard_pile', "Discard Pile", "500x400")
         dialog.transient(self.root)
         dialog.wait_visibility()
         dialog.grab_set()
 
         tk.Label(dialog, text="Discard Pile Contents",
-                 font=('Arial', 12, 'bold')).pack(pady=10)
+                 font=self._fonts['title12b']).pack(pady=10)
 
         tk.Label(dialog, text="(Bottom to Top - newest cards at bottom)",
-                 font=('Arial', 9, 'italic')).pack()
+                 font=self._fonts['note9i']).pack()
 
         # Create scrollable frame
         frame = tk.Frame(dialog)
@@ -1077,30 +2014,18 @@ class SabaccGUI:
 
         listbox = tk.Listbox(frame, width=60, height=15,
                             yscrollcommand=scrollbar.set,
-                            font=('Courier', 10))
+                            font=self._fonts['mono10'])
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
 
-        # Add cards to listbox
-        for i, card in enumerate(self.game.discard_pile):
-            rank, suit = card
-            suit_names = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'D': 'Disks', 'T': 'Trionfi'}
-            suit_name = suit_names.get(suit, suit)
-            value, _ = calculate_hand_value([card])
-
-            if suit == 'T':
-                trionfi = get_trionfi_effect(card)
-                name = trionfi.name if trionfi else f"Trionfo {rank}"
-                listbox.insert(tk.END, f"{i+1:3}. {name:<20} (value: {value:>3})")
-            else:
-                listbox.insert(tk.END, f"{i+1:3}. {rank:>2} of {suit_name:<8} (value: {value:>3})")
+        # Add cards to listbox (one insert call for the whole pile)
+        listbox.insert(tk.END, *[f"{i+1:3}. {_card_label(card)}"
+                                 for i, card in enumerate(self.game.discard_pile)])
 
-        # Total value
-        total_value, _ = calculate_hand_value(self.game.discard_pile)
         tk.Label(dialog, text=f"Total cards: {len(self.game.discard_pile)}",
-                 font=('Arial', 10)).pack(pady=5)
+                 font=self._fonts['label10']).pack(pady=5)
 
-        tk.Button(dialog, text="Close", command=dialog.destroy, width=15).pack(pady=10)
+        tk.Button(dialog, text="Close", command=lambda: self._close_dialog(dialog), width=15).pack(pady=10)
 
     # Button handlers (stubs for now)
     def on_fold(self):
@@ -1114,11 +2039,10 @@ class SabaccGUI:
         self.current_player_action['bet_action'] = 'call'
         amount_to_call = self.game.current_bet - self.game.players[0].current_bet
         if amount_to_call > 0:
-            self.log(f"You call {amount_to_call}.")
+            self.log("You call %d.", amount_to_call)
         else:
             self.log("You check.")
-        self.update_buttons()
-        self.update_display()
+        self.request_redraw()
 
     def on_raise(self):
         """Handle raise button"""
@@ -1136,40 +2060,37 @@ class SabaccGUI:
         if raise_amount:
             self.current_player_action['bet_action'] = 'raise'
             self.current_player_action['raise_amount'] = raise_amount
-            self.log(f"You raise {raise_amount}.")
-            self.update_buttons()
-            self.update_display()
+            self.log("You raise %d.", raise_amount)
+            self.request_redraw()
 
     def on_draw(self):
         """Handle draw button"""
         # Ask player where to draw from
-        draw_dialog = tk.Toplevel(self.root)
-        draw_dialog.title("Draw Card")
-        draw_dialog.geometry("300x200")
+        draw_dialog = self._open_dialog('draw', "Draw Card", "300x200")
         draw_dialog.transient(self.root)
         draw_dialog.grab_set()
 
-        tk.Label(draw_dialog, text="Draw from:", font=('Arial', 12, 'bold')).pack(pady=10)
+        tk.Label(draw_dialog, text="Draw from:", font=self._fonts['title12b']).pack(pady=10)
 
         def draw_from_pile():
             self.current_player_action['draw_action'] = 'draw_pile'
             self.log("You draw from the draw pile.")
-            draw_dialog.destroy()
+            self._close_dialog(draw_dialog)
             self.process_draw()
 
         def draw_from_discard():
             if not self.game.discard_pile:
                 messagebox.showwarning("No Cards", "Discard pile is empty!")
                 return
-            draw_dialog.destroy()
+            self._close_dialog(draw_dialog)
             self.choose_discard_pile_card()
 
         def swap_community():
-            draw_dialog.destroy()
+            self._close_dialog(draw_dialog)
             self.choose_community_swap()
 
         def skip():
-            draw_dialog.destroy()
+            self._close_dialog(draw_dialog)
             self.update_buttons()
 
         tk.Button(draw_dialog, text="Draw Pile", width=20, command=draw_from_pile).pack(pady=5)
@@ -1182,20 +2103,17 @@ class SabaccGUI:
 
     def choose_discard_pile_card(self):
         """Let player choose which card from discard pile"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Choose Card from Discard Pile")
-        dialog.geometry("400x300")
+        dialog = self._open_dialog('discard_pile_pick', "Choose Card from Discard Pile", "400x300")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Choose a card (you'll take it and all cards above it):",
-                 font=('Arial', 10, 'bold')).pack(pady=10)
+                 font=self._fonts['label10b']).pack(pady=10)
 
         listbox = tk.Listbox(dialog, width=40, height=10)
         listbox.pack(pady=5)
 
-        for i, card in enumerate(self.game.discard_pile):
-            listbox.insert(tk.END, f"{i}: {card}")
+        listbox.insert(tk.END, *[f"{i}: {card}" for i, card in enumerate(self.game.discard_pile)])
 
         def confirm():
             selection = listbox.curselection()
@@ -1205,7 +2123,7 @@ class SabaccGUI:
                 self.current_player_action['draw_index'] = idx
                 cards = self.game.discard_pile[idx:]
                 self.log(f"You draw from discard pile: {cards}")
-                dialog.destroy()
+                self._close_dialog(dialog)
                 self.process_draw()
             else:
                 messagebox.showwarning("Selection Required", "Please select a card.")
@@ -1214,52 +2132,37 @@ class SabaccGUI:
 
     def choose_community_swap(self):
         """Let player choose cards to swap with community"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Swap with Community")
-        dialog.geometry("400x400")
+        dialog = self._open_dialog('community_swap', "Swap with Community", "400x400")
         dialog.transient(self.root)
         dialog.grab_set()
 
         player = self.game.players[0]
 
-        selected_hand_idx = tk.IntVar(value=-1)
-        selected_comm_idx = tk.IntVar(value=-1)
-
         tk.Label(dialog, text="Step 1: Choose a card from your hand:",
-                 font=('Arial', 10, 'bold')).pack(pady=5)
+                 font=self._fonts['label10b']).pack(pady=5)
 
-        hand_frame = tk.Frame(dialog)
-        hand_frame.pack(pady=5)
-
-        for i, card in enumerate(player.hand):
-            rb = tk.Radiobutton(
-                hand_frame,
-                text=f"{card}",
-                variable=selected_hand_idx,
-                value=i
-            )
-            rb.pack(anchor=tk.W)
+        # One listbox per step instead of a radio button per card; exportselection
+        # is off so picking in one list doesn't clear the other
+        hand_listbox = tk.Listbox(dialog, width=30, height=max(len(player.hand), 1),
+                                  exportselection=False)
+        hand_listbox.pack(pady=5)
+        hand_listbox.insert(tk.END, *[f"{card}" for card in player.hand])
 
         tk.Label(dialog, text="Step 2: Choose a community card to take:",
-                 font=('Arial', 10, 'bold')).pack(pady=5)
+                 font=self._fonts['label10b']).pack(pady=5)
 
-        comm_frame = tk.Frame(dialog)
-        comm_frame.pack(pady=5)
-
-        for i, card in enumerate(self.game.community_cards):
-            rb = tk.Radiobutton(
-                comm_frame,
-                text=f"{card}",
-                variable=selected_comm_idx,
-                value=i
-            )
-            rb.pack(anchor=tk.W)
+        comm_listbox = tk.Listbox(dialog, width=30, height=max(len(self.game.community_cards), 1),
+                                  exportselection=False)
+        comm_listbox.pack(pady=5)
+        comm_listbox.insert(tk.END, *[f"{card}" for card in self.game.community_cards])
 
         def confirm():
-            hand_idx = selected_hand_idx.get()
-            comm_idx = selected_comm_idx.get()
+            hand_selection = hand_listbox.curselection()
+            comm_selection = comm_listbox.curselection()
 
-            if hand_idx >= 0 and comm_idx >= 0:
+            if hand_selection and comm_selection:
+                hand_idx = hand_selection[0]
+                comm_idx = comm_selection[0]
                 self.current_player_action['draw_action'] = 'community'
                 self.current_player_action['hand_card_index'] = hand_idx
                 self.current_player_action['community_card_index'] = comm_idx
@@ -1268,7 +2171,7 @@ class SabaccGUI:
                 taken = self.game.community_cards[comm_idx]
                 self.log(f"You swap {given} for {taken}")
 
-                dialog.destroy()
+                self._close_dialog(dialog)
                 self.process_draw()
             else:
                 messagebox.showwarning("Selection Required", "Please select both cards.")
@@ -1293,8 +2196,7 @@ class SabaccGUI:
             self.game.swap_with_community(player, hand_idx, comm_idx)
 
         # Update display to show new cards
-        self.update_display()
-        self.update_buttons()
+        self.request_redraw()
 
     def on_discard(self):
         """Handle discard button"""
@@ -1305,21 +2207,18 @@ class SabaccGUI:
             return
 
         # Create dialog to choose card
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Choose Card to Discard")
-        dialog.geometry("300x400")
+        dialog = self._open_dialog('discard', "Choose Card to Discard", "300x400")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Choose a card to discard:",
-                 font=('Arial', 10, 'bold')).pack(pady=10)
+                 font=self._fonts['label10b']).pack(pady=10)
 
         listbox = tk.Listbox(dialog, width=40, height=15)
         listbox.pack(pady=5)
 
-        for i, card in enumerate(player.hand):
-            value, _ = calculate_hand_value([card])
-            listbox.insert(tk.END, f"{i}: {card} (value: {value})")
+        listbox.insert(tk.END, *[f"{i}: {card} (value: {_card_value(card)})"
+                                 for i, card in enumerate(player.hand)])
 
         def confirm():
             selection = listbox.curselection()
@@ -1328,68 +2227,70 @@ class SabaccGUI:
                 self.current_player_action['discard_index'] = idx
                 card = player.hand[idx]
                 self.log(f"You will discard {card}")
-                dialog.destroy()
+                self._close_dialog(dialog)
                 self.update_buttons()
             else:
                 messagebox.showwarning("Selection Required", "Please select a card.")
 
         def skip():
             self.log("You skip discarding.")
-            dialog.destroy()
+            self._close_dialog(dialog)
             self.update_buttons()
 
         tk.Button(dialog, text="Confirm", command=confirm).pack(pady=5)
         tk.Button(dialog, text="Skip", command=skip).pack(pady=5)
 
+    def _playable_trionfi(self, player: Player) -> list:
+        """
+        Get the player's playable Trionfi, reusing the last answer while the hand is unchanged
+
+        update_buttons() and the special-card button both ask for the same
+        hand, usually several times between hand changes.
+
+        Args:
+            player: Player whose hand to check
+
+        Returns:
+            List of (card, trionfi) pairs, as from get_playable_trionfi()
+        """
+        hand = tuple(player.hand)
+        if self._playable_cache[0] != hand:
+            self._playable_cache = (hand, get_playable_trionfi(player))
+        return self._playable_cache[1]
+
     def on_play_special(self):
         """Handle play special card button"""
         player = self.game.players[0]
-        playable = get_playable_trionfi(player)
+        playable = self._playable_trionfi(player)
 
         if not playable:
             messagebox.showinfo("No Special Cards", "You have no special cards to play.")
             return
 
         # Create dialog to choose special card
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Play Special Card")
-        dialog.geometry("400x300")
+        dialog = self._open_dialog('special', "Play Special Card", "400x300")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Choose a special card to play:",
-                 font=('Arial', 10, 'bold')).pack(pady=10)
+                 font=self._fonts['label10b']).pack(pady=10)
 
         listbox = tk.Listbox(dialog, width=50, height=10)
         listbox.pack(pady=5)
 
-        for i, (card, trionfi) in enumerate(playable):
-            listbox.insert(tk.END, f"{trionfi.name} - {trionfi.description}")
+        listbox.insert(tk.END, *[f"{trionfi.name} - {trionfi.description}" for _, trionfi in playable])
 
         def confirm():
             selection = listbox.curselection()
             if selection:
                 idx = selection[0]
                 card, trionfi = playable[idx]
-                dialog.destroy()
+                self._close_dialog(dialog)
 
                 # Handle specific trionfi with GUI dialogs
-                if trionfi.number == 4:  # The Emperor
-                    self.play_emperor_effect(card)
-                elif trionfi.number == 5:  # The Hierophant
-                    self.play_hierophant_effect(card)
-                elif trionfi.number == 9:  # The Hermit
-                    self.play_hermit_effect(card)
-                elif trionfi.number == 10:  # Wheel of Fortune
-                    self.play_wheel_of_fortune_effect(card)
-                elif trionfi.number == 18:  # The Moon
-                    self.play_moon_effect(card)
-                elif trionfi.number == 19:  # The Sun
-                    self.play_sun_effect(card)
-                elif trionfi.number == 20:  # The Last Judgment
-                    self.play_judgment_effect(card)
-                elif trionfi.number == 21:  # The Universe
-                    self.play_universe_effect(card)
+                handler = self._trionfi_dispatch.get(trionfi.number)
+                if handler:
+                    handler(card)
                 else:
                     # For other trionfi, use the default behavior
                     self.current_player_action['play_trionfi'] = card
@@ -1405,48 +2306,55 @@ class SabaccGUI:
         player = self.game.players[0]
 
         # Get valid targets
-        targets = [p for p in self.game.players
-                   if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+        targets = self.game.active_opponents_of(player, include_hermits=False)
 
         if not targets:
             messagebox.showinfo("No Targets", "No valid targets for The Emperor's effect.")
             return
 
         # Create target selection dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title("The Emperor - Choose Target")
-        dialog.geometry("300x200")
+        dialog = self._open_dialog('emperor_target', "The Emperor - Choose Target", "300x200")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Choose a player to target:",
-                 font=('Arial', 10, 'bold')).pack(pady=10)
+                 font=self._fonts['label10b']).pack(pady=10)
 
         listbox = tk.Listbox(dialog, width=30, height=6)
         listbox.pack(pady=5)
 
-        for i, p in enumerate(targets):
-            listbox.insert(tk.END, f"{p.name} ({p.credits} credits)")
+        listbox.insert(tk.END, *[f"{p.name} ({p.credits} credits)" for p in targets])
 
         def confirm_target():
             selection = listbox.curselection()
             if selection:
                 target = targets[selection[0]]
-                dialog.destroy()
+                self._close_dialog(dialog)
                 self.emperor_target_response(player, target, card)
             else:
                 messagebox.showwarning("Selection Required", "Please select a target.")
 
         tk.Button(dialog, text="Target", command=confirm_target).pack(pady=10)
 
+    def _remove_played_card(self, player, card):
+        """
+        Move a played Trionfi from a player's hand to the removed pile
+
+        Does nothing if the card is no longer in the hand.
+
+        Args:
+            player: Player who played the card
+            card: The card tuple (rank, suit)
+        """
+        if player.remove_card(card):
+            self.game.removed_pile.append(card)
+
     def emperor_target_response(self, attacker, target, card):
         """Handle the target's response to The Emperor"""
         self.log(f"\n👑 {attacker.name} plays The Emperor targeting {target.name}!")
 
         # Remove the card from attacker's hand
-        if card in attacker.hand:
-            attacker.hand.remove(card)
-            self.game.removed_pile.append(card)
+        self._remove_played_card(attacker, card)
 
         if target.is_human:
             # Human target - show choice dialog
@@ -1457,14 +2365,12 @@ class SabaccGUI:
 
     def emperor_human_response(self, target):
         """Show dialog for human player to respond to Emperor"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("The Emperor - Your Response")
-        dialog.geometry("350x200")
+        dialog = self._open_dialog('emperor_response', "The Emperor - Your Response", "350x200")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text=f"You have been targeted by The Emperor!",
-                 font=('Arial', 10, 'bold')).pack(pady=5)
+                 font=self._fonts['label10b']).pack(pady=5)
         tk.Label(dialog, text="Choose your response:").pack(pady=5)
 
         def ante_up():
@@ -1475,23 +2381,23 @@ class SabaccGUI:
             else:
                 self.log(f"{target.name} doesn't have enough credits and must fold!")
                 self.game.player_fold(target)
-            dialog.destroy()
-            self.update_display()
+            self._close_dialog(dialog)
+            self.request_redraw()
 
         def discard_two():
-            dialog.destroy()
+            self._close_dialog(dialog)
             if len(target.hand) >= 2:
                 self.emperor_discard_two(target)
             else:
                 self.log(f"{target.name} doesn't have 2 cards and must fold!")
                 self.game.player_fold(target)
-                self.update_display()
+                self.request_redraw()
 
         def fold():
             self.game.player_fold(target)
             self.log(f"{target.name} folds.")
-            dialog.destroy()
-            self.update_display()
+            self._close_dialog(dialog)
+            self.request_redraw()
 
         tk.Button(dialog, text=f"Ante up {self.game.min_bet} credits",
                   width=25, command=ante_up).pack(pady=5)
@@ -1502,36 +2408,30 @@ class SabaccGUI:
 
     def emperor_discard_two(self, target):
         """Dialog for target to discard 2 cards"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Discard 2 Cards")
-        dialog.geometry("350x350")
+        dialog = self._open_dialog('emperor_discard', "Discard 2 Cards", "350x350")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Select 2 cards to discard:",
-                 font=('Arial', 10, 'bold')).pack(pady=10)
-
-        # Use checkbuttons for multi-select
-        selected = []
-        check_vars = []
+                 font=self._fonts['label10b']).pack(pady=10)
 
-        for i, card in enumerate(target.hand):
-            var = tk.BooleanVar()
-            check_vars.append(var)
-            cb = tk.Checkbutton(dialog, text=f"{card}", variable=var)
-            cb.pack(anchor=tk.W, padx=20)
+        # A single multi-select listbox instead of a checkbutton per card
+        listbox = tk.Listbox(dialog, width=30, height=max(len(target.hand), 1),
+                             selectmode=tk.MULTIPLE)
+        listbox.pack(padx=20)
+        listbox.insert(tk.END, *[f"{card}" for card in target.hand])
 
         def confirm():
-            selected_indices = [i for i, var in enumerate(check_vars) if var.get()]
+            selected_indices = listbox.curselection()
             if len(selected_indices) == 2:
-                # Discard the selected cards
+                # Discard the selected cards, rebuilding the hand in one pass
                 cards_to_discard = [target.hand[i] for i in selected_indices]
-                for c in cards_to_discard:
-                    target.hand.remove(c)
-                    self.game.discard_pile.append(c)
+                discard_indices = set(selected_indices)
+                target.hand[:] = [c for i, c in enumerate(target.hand) if i not in discard_indices]
+                self.game.discard_pile.extend(cards_to_discard)
                 self.log(f"{target.name} discards {cards_to_discard}")
-                dialog.destroy()
-                self.update_display()
+                self._close_dialog(dialog)
+                self.request_redraw()
             else:
                 messagebox.showwarning("Selection Required", "Please select exactly 2 cards.")
 
@@ -1539,7 +2439,7 @@ class SabaccGUI:
 
     def emperor_ai_response(self, target):
         """AI response to The Emperor"""
-        value, busted = calculate_hand_value(target.hand)
+        value, busted = _hand_value(target.hand)
 
         if busted or abs(value) < 10:
             self.game.player_fold(target)
@@ -1551,16 +2451,17 @@ class SabaccGUI:
         else:
             if len(target.hand) >= 2:
                 import random
-                to_discard = random.sample(target.hand, 2)
-                for c in to_discard:
-                    target.hand.remove(c)
-                    self.game.discard_pile.append(c)
+                # Sample positions rather than cards, then rebuild the hand in one pass
+                indices = random.sample(range(len(target.hand)), 2)
+                to_discard = [target.hand[i] for i in indices]
+                target.hand[:] = [c for i, c in enumerate(target.hand) if i not in indices]
+                self.game.discard_pile.extend(to_discard)
                 self.log(f"{target.name} discards 2 cards.")
             else:
                 self.game.player_fold(target)
                 self.log(f"{target.name} folds.")
 
-        self.update_display()
+        self.request_redraw()
 
     def play_hierophant_effect(self, card):
         """GUI handler for The Hierophant effect"""
@@ -1570,18 +2471,16 @@ class SabaccGUI:
         self.log("All players must reveal their hand values or fold!")
 
         # Remove the card from hand
-        if card in player.hand:
-            player.hand.remove(card)
-            self.game.removed_pile.append(card)
+        self._remove_played_card(player, card)
 
         # Process all other players
         revealed_info = []
         for p in self.game.players:
-            if p == player or p.has_folded or getattr(p, 'is_hermit', False):
+            if p is player or p.has_folded or p.is_hermit:
                 continue
 
             # AI players auto-decide based on hand strength
-            value, busted = calculate_hand_value(p.hand)
+            value, busted = _hand_value(p.hand)
 
             if busted or abs(value) < 8:
                 self.game.player_fold(p)
@@ -1593,8 +2492,7 @@ class SabaccGUI:
                 revealed_info.append(f"{p.name}: {value} {status}")
 
         # Update display
-        self.update_display()
-        self.update_buttons()
+        self.request_redraw()
 
         # Show summary dialog
         if revealed_info:
@@ -1618,8 +2516,7 @@ class SabaccGUI:
         # So we don't remove the card
 
         # Disable all actions and update display
-        self.update_display()
-        self.update_buttons()
+        self.request_redraw()
 
         messagebox.showinfo("The Hermit",
             "You have withdrawn from betting.\n"
@@ -1633,9 +2530,7 @@ class SabaccGUI:
         self.log(f"\n🎡 {player.name} plays Wheel of Fortune!")
 
         # Remove the card from hand
-        if card in player.hand:
-            player.hand.remove(card)
-            self.game.removed_pile.append(card)
+        self._remove_played_card(player, card)
 
         # Ensure enough cards available
         self.game.ensure_cards_available(4)
@@ -1649,36 +2544,27 @@ class SabaccGUI:
         self.log(f"Drew 4 cards: {drawn_cards}")
 
         # Create dialog to choose which cards to keep
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Wheel of Fortune - Choose Cards to Keep")
-        dialog.geometry("400x350")
+        dialog = self._open_dialog('wheel', "Wheel of Fortune - Choose Cards to Keep", "400x350")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="Select which cards to keep:",
-                 font=('Arial', 10, 'bold')).pack(pady=10)
+                 font=self._fonts['label10b']).pack(pady=10)
 
         tk.Label(dialog, text=f"Your current hand: {player.hand}",
-                 font=('Arial', 9)).pack(pady=5)
+                 font=self._fonts['label9']).pack(pady=5)
 
-        # Checkboxes for each drawn card
-        check_vars = []
-        for i, drawn_card in enumerate(drawn_cards):
-            var = tk.BooleanVar(value=True)  # Default to keeping all
-            check_vars.append(var)
-            value, _ = calculate_hand_value([drawn_card])
-            cb = tk.Checkbutton(dialog, text=f"{drawn_card} (value: {value})", variable=var)
-            cb.pack(anchor=tk.W, padx=20)
+        # One multi-select listbox for the drawn cards
+        listbox = tk.Listbox(dialog, width=40, height=len(drawn_cards), selectmode=tk.MULTIPLE)
+        listbox.pack(padx=20)
+        listbox.insert(tk.END, *[f"{drawn_card} (value: {_card_value(drawn_card)})"
+                                 for drawn_card in drawn_cards])
+        listbox.selection_set(0, tk.END)  # Default to keeping all
 
         def confirm():
-            kept_cards = []
-            discarded_cards = []
-
-            for i, var in enumerate(check_vars):
-                if var.get():
-                    kept_cards.append(drawn_cards[i])
-                else:
-                    discarded_cards.append(drawn_cards[i])
+            kept_indices = set(listbox.curselection())
+            kept_cards = [c for i, c in enumerate(drawn_cards) if i in kept_indices]
+            discarded_cards = [c for i, c in enumerate(drawn_cards) if i not in kept_indices]
 
             # Add kept cards to hand
             player.hand.extend(kept_cards)
@@ -1690,17 +2576,14 @@ class SabaccGUI:
             if discarded_cards:
                 self.log(f"Discarded: {discarded_cards}")
 
-            dialog.destroy()
-            self.update_display()
-            self.update_buttons()
+            self._close_dialog(dialog)
+            self.request_redraw()
 
         def keep_all():
-            for var in check_vars:
-                var.set(True)
+            listbox.selection_set(0, tk.END)
 
         def keep_none():
-            for var in check_vars:
-                var.set(False)
+            listbox.selection_clear(0, tk.END)
 
         button_frame = tk.Frame(dialog)
         button_frame.pack(pady=10)
@@ -1717,25 +2600,23 @@ class SabaccGUI:
         self.log(f"\n🌙 {player.name} plays The Moon!")
 
         # Remove the card from hand
-        if card in player.hand:
-            player.hand.remove(card)
-            self.game.removed_pile.append(card)
+        self._remove_played_card(player, card)
 
         # Deal a new community card
         self.game.ensure_cards_available(1)
         new_card = self.game.draw_pile.draw()
         self.game.community_cards.append(new_card)
 
+        community_str = str(self.game.community_cards)  # Shared by the log and the notice
         self.log(f"Dealer adds {new_card} to the community cards.")
-        self.log(f"Community cards: {self.game.community_cards}")
+        self.log(f"Community cards: {community_str}")
 
         # Update display
-        self.update_display()
-        self.update_buttons()
+        self.request_redraw()
 
-        messagebox.showinfo("The Moon",
+        self.show_toast("The Moon",
             f"A new community card has been dealt:\n{new_card}\n\n"
-            f"Community cards are now:\n{self.game.community_cards}")
+            f"Community cards are now:\n{community_str}")
 
     def play_sun_effect(self, card):
         """GUI handler for The Sun effect"""
@@ -1751,21 +2632,19 @@ class SabaccGUI:
         # So we don't remove the card
 
         # Log all hands
-        self.log("\n=== ALL HANDS REVEALED ===")
+        # One line per hand, shared by the log and the summary dialog
         revealed_info = []
         for p in self.game.players:
             if not p.has_folded:
-                value, busted = calculate_hand_value(p.hand)
+                value, busted = _hand_value(p.hand)
                 status = "[BUSTED]" if busted else "[OK]"
-                self.log(f"{p.name}: {p.hand} = {value} {status}")
-                revealed_info.append(f"{p.name}: {value} {status}")
-        self.log("=" * 30)
+                revealed_info.append(f"{p.name}: {p.hand} = {value} {status}")
+        self.log_many(["\n=== ALL HANDS REVEALED ===", *revealed_info, "=" * 30])
 
         # Update display - opponent cards will now show face up
-        self.update_display()
-        self.update_buttons()
+        self.request_redraw()
 
-        messagebox.showinfo("The Sun",
+        self.show_toast("The Sun",
             "All hands are now revealed!\n\n" +
             "\n".join(revealed_info))
 
@@ -1777,15 +2656,13 @@ class SabaccGUI:
         self.log("The hand immediately ends and advances to showdown!")
 
         # Remove the card from hand
-        if card in player.hand:
-            player.hand.remove(card)
-            self.game.removed_pile.append(card)
+        self._remove_played_card(player, card)
 
         # Set the flag
         self.game.judgment_played = True
 
         # Show message before showdown
-        messagebox.showinfo("The Last Judgment",
+        self.show_toast("The Last Judgment",
             "The hand ends immediately!\n"
             "Advancing to showdown...")
 
@@ -1799,46 +2676,37 @@ class SabaccGUI:
         self.log(f"\n🌌 {player.name} plays The Universe - See the Future!")
 
         # Remove the card from hand
-        if card in player.hand:
-            player.hand.remove(card)
-            self.game.removed_pile.append(card)
+        self._remove_played_card(player, card)
 
         # Check if enough cards
         if len(self.game.draw_pile.cards) < 6:
             messagebox.showwarning("The Universe",
                 "Not enough cards in the draw pile to use this effect.")
-            self.update_display()
-            self.update_buttons()
+            self.request_redraw()
             return
 
-        # Peek at top 6 cards (don't remove them)
-        top_6 = self.game.draw_pile.cards[:6]
-
         self.log("You peek at the top 6 cards of the draw pile...")
 
         # Create dialog to show the cards
-        dialog = tk.Toplevel(self.root)
-        dialog.title("The Universe - See the Future")
-        dialog.geometry("400x350")
+        dialog = self._open_dialog('universe', "The Universe - See the Future", "400x350")
         dialog.transient(self.root)
         dialog.grab_set()
 
         tk.Label(dialog, text="🌌 The Top 6 Cards 🌌",
-                 font=('Arial', 12, 'bold')).pack(pady=10)
+                 font=self._fonts['title12b']).pack(pady=10)
 
         tk.Label(dialog, text="(In order from top to bottom - don't show anyone!)",
-                 font=('Arial', 9, 'italic')).pack(pady=5)
+                 font=self._fonts['note9i']).pack(pady=5)
 
-        # Show each card with its value
-        for i, peek_card in enumerate(top_6):
-            value, _ = calculate_hand_value([peek_card])
-            tk.Label(dialog, text=f"{i+1}. {peek_card} (value: {value})",
-                     font=('Arial', 11)).pack(anchor=tk.W, padx=30)
+        # Peek at the top 6 cards in place (don't remove or copy them); the
+        # top of the deck is the end of the list
+        for i, peek_card in enumerate(itertools.islice(reversed(self.game.draw_pile.cards), 6)):
+            tk.Label(dialog, text=f"{i+1}. {peek_card} (value: {_card_value(peek_card)})",
+                     font=self._fonts['item11']).pack(anchor=tk.W, padx=30)
 
         def close():
-            dialog.destroy()
-            self.update_display()
-            self.update_buttons()
+            self._close_dialog(dialog)
+            self.request_redraw()
 
         tk.Button(dialog, text="Got it!", command=close, width=15).pack(pady=20)
 
@@ -1856,39 +2724,96 @@ class SabaccGUI:
         # Clear action
         self.current_player_action = {}
 
-        # Update display
-        self.update_display()
-
-        # Update buttons immediately to disable them if player folded
+        # Update buttons immediately to disable them if player folded; the
+        # table itself can wait for the coalesced redraw
         self.update_buttons()
+        self.request_redraw()
 
         # Check if betting round is complete
         if self.game.is_betting_round_complete():
             self.log("\nBetting round complete!")
             self.set_turn_waiting("Round Complete")
-            self.root.after(1000, self.advance_to_next_phase)
+            self._chain(self.advance_to_next_phase, pace_ms=PACE_STEP_MS)
         else:
             # Let AI players take their turns
             self.set_turn_waiting("AI Playing...")
-            self.root.after(1000, self.process_ai_turns)
+            self._chain(self.process_ai_turns, pace_ms=PACE_STEP_MS)
+
+    def _chain(self, next_fn, pace_ms: int = 0):
+        """
+        Schedule the next step of the game
+
+        Args:
+            next_fn: Callable to run
+            pace_ms: Pause before it runs (one of the PACE_* constants); 0 runs
+                     it as soon as Tk is idle
+        """
+        if pace_ms:
+            self.root.after(pace_ms, next_fn)
+        else:
+            self.root.after_idle(next_fn)
 
     def process_ai_turns(self):
-        """Process all AI player turns"""
-        for player in self.game.players[1:]:
-            if not player.has_folded and player.credits > 0 and not player.has_acted:
+        """Process all AI player turns on a worker thread, keeping the Tk thread responsive"""
+        if self._ai_thread is not None:
+            return
+
+        self._ai_thread = threading.Thread(target=self._ai_worker, args=(self.game,), daemon=True)
+        self._ai_thread.start()
+        self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+    def _ai_worker(self, game: GameState):
+        """
+        Play every pending AI turn (worker thread)
+
+        Tk may only be touched from the main thread, so every UI change is
+        posted to _ui_queue as a callable instead of being made here.
+
+        Args:
+            game: The game being played when the worker was started
+        """
+        post = self._ui_queue.put
+        try:
+            for player in game.players[1:]:
+                if player.has_folded or player.credits <= 0 or player.has_acted:
+                    continue
+                name = player.name
+
                 # Show AI indicator
-                self.set_turn_ai(player.name)
-                self.root.update()  # Force UI update
+                post(lambda name=name: self.set_turn_ai(name))
 
                 # Get AI action
-                action = get_simple_ai_action(self.game, player)
+                action = get_simple_ai_action(game, player)
 
                 # Execute turn
-                self.game.execute_player_turn(player, action)
+                game.execute_player_turn(player, action)
 
                 # Log action
                 bet_action = action.get('bet_action', 'unknown')
-                self.log(f"{player.name} {bet_action}s")
+                post(lambda name=name, bet=bet_action: self.log("%s %ss", name, bet))
+        except Exception as error:
+            # Re-raise on the Tk thread so it's reported like any other callback error
+            post(lambda error=error: _raise(error))
+        finally:
+            post(lambda: self._finish_ai_turns(game))
+
+    def _drain_ui_queue(self):
+        """Run the callables posted by the AI worker (Tk thread)"""
+        if self._ai_thread is not None:
+            self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            callback()
+
+    def _finish_ai_turns(self, game: GameState):
+        """Pick up on the Tk thread once the AI worker is done"""
+        self._ai_thread = None
+        if game is not self.game:
+            return  # A new game was started meanwhile
 
         # Update display
         self.update_display()
@@ -1897,11 +2822,14 @@ class SabaccGUI:
         if self.game.is_betting_round_complete():
             self.log("\nBetting round complete!")
             self.set_turn_waiting("Round Complete")
-            self.root.after(1000, self.advance_to_next_phase)
+            self._chain(self.advance_to_next_phase, pace_ms=PACE_STEP_MS)
         else:
             # Back to player
             self.update_buttons()
 
+        if self._dirty:
+            self.request_redraw()
+
     def advance_to_next_phase(self):
         """Advance to the next phase of the hand"""
         # Check if only one player remains
@@ -1931,59 +2859,66 @@ class SabaccGUI:
         self.game.reset_for_betting_round()
         self.current_player_action = {}
 
-        # Update display
-        self.update_display()
-
         # Start new betting round
         self.log("\nYour turn! Place your bet.")
-        self.update_buttons()
+        self.request_redraw()
 
     def do_showdown(self):
         """Handle the showdown phase"""
         self.current_phase = 'showdown'
         self.set_turn_waiting("Showdown")
-        self.log("\n=== SHOWDOWN ===")
+        lines = ["\n=== SHOWDOWN ==="]
 
         active_players = self.game.get_active_players()
 
-        # Show all hands
-        for player in active_players:
-            value, busted = calculate_hand_value(player.hand)
-            status = " [BUSTED]" if busted else ""
-            self.log(f"{player.name}: {player.hand} = {value}{status}")
-
-        # Determine winner
-        winner = self.game.determine_winner()
+        if len(active_players) == 1:
+            # Everyone else folded, so there are no hands to score or compare
+            winner = active_players[0]
+            self.game.tiebreaker_info = None
+            lines.append(f"\n{winner.name} wins uncontested!")
+        else:
+            # Show all hands
+            for player in active_players:
+                hand = player.hand
+                value, busted = _hand_value(hand)
+                status = " [BUSTED]" if busted else ""
+                lines.append(f"{player.name}: {hand} = {value}{status}")
+
+            # Determine winner
+            winner = self.game.determine_winner()
+
+            if winner:
+                value, _ = _hand_value(winner.hand)
+
+                # Check if a tiebreaker was used
+                if self.game.tiebreaker_info:
+                    tb_info = self.game.tiebreaker_info
+                    tied_str = " and ".join(tb_info['tied_players'])
+                    values_str = ", ".join(str(v) for v in tb_info['tied_values'])
+
+                    lines.append(f"\nTIE: {tied_str} are tied with values {values_str}")
+
+                    if tb_info['type'] == 'high_card':
+                        lines.append(f"TIEBREAKER: {winner.name} wins by high card (value {tb_info['winner_high_card']})!")
+                    elif tb_info['type'] == 'suit':
+                        lines.append(f"TIEBREAKER: {winner.name} wins by suit ({tb_info['winner_suit']})!")
+                else:
+                    lines.append(f"\n{winner.name} wins with a hand value of {value}!")
 
         if winner:
-            value, _ = calculate_hand_value(winner.hand)
-
-            # Check if a tiebreaker was used
-            if self.game.tiebreaker_info:
-                tb_info = self.game.tiebreaker_info
-                tied_str = " and ".join(tb_info['tied_players'])
-                values_str = ", ".join(str(v) for v in tb_info['tied_values'])
-
-                self.log(f"\nTIE: {tied_str} are tied with values {values_str}")
-
-                if tb_info['type'] == 'high_card':
-                    self.log(f"TIEBREAKER: {winner.name} wins by high card (value {tb_info['winner_high_card']})!")
-                elif tb_info['type'] == 'suit':
-                    self.log(f"TIEBREAKER: {winner.name} wins by suit ({tb_info['winner_suit']})!")
-            else:
-                self.log(f"\n{winner.name} wins with a hand value of {value}!")
-
             self.game.award_pot(winner)
-            self.log(f"{winner.name} now has {winner.credits} credits.")
+            lines.append(f"{winner.name} now has {winner.credits} credits.")
         else:
-            self.log("\nNo winner - everyone busted!")
+            lines.append("\nNo winner - everyone busted!")
             self.game.pot = 0
 
+        self.log_many(lines)
+
         # Advance dealer
         self.game.advance_dealer()
 
         # Update display
-        self.update_display()
+        self.request_redraw()
 
         # Check if game should continue
         players_with_credits = [p for p in self.game.players if p.credits > 0]
@@ -1996,7 +2931,7 @@ class SabaccGUI:
                 self.log("Everyone is out of credits!")
         else:
             # Ask to continue
-            self.root.after(2000, self.prompt_new_hand)
+            self._chain(self.prompt_new_hand, pace_ms=PACE_NEW_HAND_MS)
 
     def prompt_new_hand(self):
         """Prompt user to start a new hand"""
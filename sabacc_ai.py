@@ -3,8 +3,128 @@
 Sabacc con i Tarocchi - AI Player Logic
 """
 
+import math
 import random
-from sabacc_game import GameState, Player, calculate_hand_value
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+from itertools import combinations
+from operator import attrgetter, itemgetter
+from sabacc_game import (CARD_COMPONENTS, DEVIL_CARD, GameState, Player, calculate_hand_value,
+                         finalize_hand_value)
+
+# Bound method of the shared module-level generator: one global lookup per
+# roll instead of two, while random.seed() still reproduces every decision.
+_random = random.random
+
+# Sort key for targeting players by stack size
+_credits = attrgetter('credits')
+
+# Distance-to-23 recorded for a busted hand. Real distances are 0-23, so any
+# larger int sorts after every playable hand and keeps distance math in ints.
+BUST_DISTANCE = 1000
+
+
+def _distance_to_23(value, is_busted):
+    """
+    How far a scored hand is from 23; BUST_DISTANCE for a busted hand.
+
+    A playable hand has |value| <= 23, so its distance is just 23 - |value|.
+    """
+    if is_busted:
+        return BUST_DISTANCE
+    return 23 - abs(value)
+
+
+def _evaluate_hand(hand):
+    """
+    Score a hand and measure how far it is from 23.
+
+    The AI search scores the same sets of cards over and over (every swap,
+    draw and discard candidate), and scoring doesn't depend on card order,
+    so results are memoized on the sorted cards.
+
+    Args:
+        hand: List of card tuples (rank, suit)
+
+    Returns:
+        (value, is_busted, distance) tuple; distance is BUST_DISTANCE for a busted hand
+    """
+    return _evaluate_sorted_hand(tuple(sorted(hand)))
+
+
+@lru_cache(maxsize=4096)
+def _evaluate_sorted_hand(hand_key):
+    """Score a sorted hand tuple (memoized; see _evaluate_hand())"""
+    value, is_busted = calculate_hand_value(hand_key)
+    return value, is_busted, _distance_to_23(value, is_busted)
+
+
+# A hand's CARD_COMPONENTS as parallel per-card columns plus their totals.
+# Hands that only differ by a few cards can be scored by adding or
+# subtracting those cards' entries and calling _evaluate_components().
+HandView = namedtuple('HandView', [
+    'card_values', 'card_aces', 'card_lovers',  # One entry per card, in hand order
+    'value', 'aces', 'lovers',  # Totals; lovers counts The Lovers cards
+])
+
+
+def _hand_view(hand):
+    """
+    Split a hand into a HandView.
+
+    Memoized on the hand's cards, so the swap, draw and discard searches in
+    one AI decision share a single conversion of the player's hand.
+
+    Args:
+        hand: List of card tuples (rank, suit)
+
+    Returns:
+        HandView of the hand
+    """
+    return _hand_view_of(tuple(hand))
+
+
+@lru_cache(maxsize=256)
+def _hand_view_of(cards):
+    """Build the HandView for a tuple of cards (memoized; see _hand_view())"""
+    if not cards:
+        return HandView((), (), (), 0, 0, 0)
+    card_values, card_aces, card_lovers = zip(*[CARD_COMPONENTS[card] for card in cards])
+    return HandView(card_values, card_aces, card_lovers,
+                    sum(card_values), sum(card_aces), sum(card_lovers))
+
+
+@lru_cache(maxsize=None)
+def _evaluate_components(value, aces, lovers):
+    """
+    Like _evaluate_hand(), but for a hand given as summed card components.
+
+    Every hand with the same component sums has the same value, so the sums
+    are a perfect key for the result; the table fills lazily as searches
+    reach new sums and stays small (a few thousand entries at most).
+
+    Returns:
+        (value, is_busted, distance) tuple; distance is BUST_DISTANCE for a busted hand
+    """
+    value, is_busted = finalize_hand_value(value, aces, lovers)
+    return value, is_busted, _distance_to_23(value, is_busted)
+
+
+# Hand strength multiplier by fold frequency bucket:
+#   < 0.25 very loose (1.3), < 0.35 loose (1.15), 0.35-0.5 average (1.0),
+#   > 0.5 tight (0.85), > 0.6 very tight (0.7)
+# bisect_left counts thresholds strictly below the frequency, so the two
+# "<" bounds are nudged down one ulp to let exactly 0.25 / 0.35 move up a bucket.
+_FOLD_FREQUENCY_THRESHOLDS = (math.nextafter(0.25, 0.0), math.nextafter(0.35, 0.0), 0.5, 0.6)
+_FOLD_FREQUENCY_MULTIPLIERS = (1.3, 1.15, 1.0, 0.85, 0.7)
+
+
+# Read-only view of an OpponentModel's derived betting stats
+OpponentSnapshot = namedtuple('OpponentSnapshot', [
+    'fold_frequency', 'aggression_factor', 'hand_strength_multiplier',
+    'is_tight', 'is_loose', 'is_aggressive',
+])
 
 
 class OpponentModel:
@@ -13,6 +133,13 @@ class OpponentModel:
     Used to adjust AI strategy based on observed behavior.
     """
 
+    # One model lives for every opponent name seen, so skip the per-instance dict
+    __slots__ = (
+        'player_name', 'hands_played', 'folds', 'calls', 'raises',
+        'showdowns', 'showdown_distance_total', 'preflop_raises', 'postflop_raises',
+        '_snapshot',
+    )
+
     def __init__(self, player_name):
         self.player_name = player_name
 
@@ -24,14 +151,18 @@ class OpponentModel:
 
         # Showdown data
         self.showdowns = 0
-        self.showdown_distances = []  # Track distance-to-23 values at showdown
+        self.showdown_distance_total = 0.0  # Running sum of distance-to-23 values at showdown
 
         # Aggression metrics
         self.preflop_raises = 0
         self.postflop_raises = 0
 
+        # OpponentSnapshot, recomputed only after a new action has been recorded
+        self._snapshot = None
+
     def record_action(self, action_type, is_preflop=False):
         """Record a betting action"""
+        self._snapshot = None
         if action_type == 'fold':
             self.folds += 1
         elif action_type == 'call':
@@ -46,38 +177,71 @@ class OpponentModel:
     def record_showdown(self, hand_distance):
         """Record hand strength shown at showdown"""
         self.showdowns += 1
-        self.showdown_distances.append(hand_distance)
+        self.showdown_distance_total += hand_distance
+
+    def snapshot(self):
+        """
+        Betting statistics derived from the action counts.
+
+        The AI reads these several times per opponent per decision, but they
+        only change when record_action() is called.
+
+        Returns:
+            OpponentSnapshot of the current stats
+        """
+        if self._snapshot is None:
+            fold_freq = self._compute_fold_frequency()
+            aggression = self._compute_aggression_factor()
+            self._snapshot = OpponentSnapshot(
+                fold_frequency=fold_freq,
+                aggression_factor=aggression,
+                hand_strength_multiplier=self._compute_hand_strength_multiplier(fold_freq),
+                is_tight=fold_freq > 0.5,  # Tight players fold often (>50%)
+                is_loose=fold_freq < 0.3,  # Loose players fold rarely (<30%)
+                is_aggressive=aggression > 0.5,  # Aggressive players raise often
+            )
+        return self._snapshot
 
     def get_fold_frequency(self):
         """What % of time does this opponent fold?"""
+        return self.snapshot().fold_frequency
+
+    def get_aggression_factor(self):
+        """How aggressive is this opponent? (raises / calls)"""
+        return self.snapshot().aggression_factor
+
+    def has_observed_actions(self):
+        """Has any betting action been recorded for this opponent?"""
+        return bool(self.folds or self.calls or self.raises)
+
+    def _compute_fold_frequency(self):
         total_actions = self.folds + self.calls + self.raises
         if total_actions == 0:
             return 0.5  # Unknown, assume average
         return self.folds / total_actions
 
-    def get_aggression_factor(self):
-        """How aggressive is this opponent? (raises / calls)"""
+    def _compute_aggression_factor(self):
         if self.calls == 0:
             return 1.0 if self.raises > 0 else 0.5
         return self.raises / (self.calls + self.raises)
 
     def get_average_showdown_distance(self):
         """What hand strength do they typically show at showdown?"""
-        if not self.showdown_distances:
+        if not self.showdowns:
             return 10.0  # Unknown, assume medium strength
-        return sum(self.showdown_distances) / len(self.showdown_distances)
+        return self.showdown_distance_total / self.showdowns
 
     def is_tight_player(self):
         """Tight players fold often (>50%)"""
-        return self.get_fold_frequency() > 0.5
+        return self.snapshot().is_tight
 
     def is_loose_player(self):
         """Loose players fold rarely (<30%)"""
-        return self.get_fold_frequency() < 0.3
+        return self.snapshot().is_loose
 
     def is_aggressive_player(self):
         """Aggressive players raise often (aggression > 0.5)"""
-        return self.get_aggression_factor() > 0.5
+        return self.snapshot().is_aggressive
 
     def get_expected_hand_strength_multiplier(self):
         """
@@ -88,18 +252,11 @@ class OpponentModel:
         Loose players: 1.2 (weaker than average)
         Average: 1.0
         """
-        fold_freq = self.get_fold_frequency()
+        return self.snapshot().hand_strength_multiplier
 
-        if fold_freq > 0.6:  # Very tight
-            return 0.7
-        elif fold_freq > 0.5:  # Tight
-            return 0.85
-        elif fold_freq < 0.25:  # Very loose
-            return 1.3
-        elif fold_freq < 0.35:  # Loose
-            return 1.15
-        else:  # Average
-            return 1.0
+    @staticmethod
+    def _compute_hand_strength_multiplier(fold_freq):
+        return _FOLD_FREQUENCY_MULTIPLIERS[bisect_left(_FOLD_FREQUENCY_THRESHOLDS, fold_freq)]
 
 
 # Global opponent models (keyed by player name)
@@ -113,6 +270,20 @@ def get_opponent_model(player_name):
     return OPPONENT_MODELS[player_name]
 
 
+def get_player_model(player: Player):
+    """
+    Get or create the opponent model for a player object.
+
+    The model is cached on the player, so repeat lookups during a decision
+    read an attribute instead of hashing the name. It is the same object
+    get_opponent_model() returns for the player's name.
+    """
+    model = player.opponent_model
+    if model is None:
+        model = player.opponent_model = get_opponent_model(player.name)
+    return model
+
+
 def update_opponent_action(player_name, action_type, is_preflop=False):
     """Record an opponent's action for modeling"""
     model = get_opponent_model(player_name)
@@ -122,31 +293,22 @@ def update_opponent_action(player_name, action_type, is_preflop=False):
 def update_opponent_showdown(player_name, hand):
     """Record an opponent's hand at showdown"""
     model = get_opponent_model(player_name)
-    value, is_busted = calculate_hand_value(hand)
-    distance = abs(abs(value) - 23) if not is_busted else float('inf')
+    value, is_busted, distance = _evaluate_hand(hand)
     model.record_showdown(distance)
 
 
-def analyze_opponents(game: GameState, player: Player):
+def _win_probability_adjustment(avg_multiplier):
     """
-    Analyze active opponents and adjust our win probability estimate.
+    Turn the opponents' average hand strength multiplier into an adjustment
+    for our own win probability.
+
+    Args:
+        avg_multiplier: Mean of get_expected_hand_strength_multiplier() over
+                        the active opponents
 
     Returns:
-        Adjustment factor for our win probability (0.8 to 1.2)
+        Adjustment factor for our win probability (0.7 to 1.3)
     """
-    active_opponents = [p for p in game.players if p != player and not p.has_folded]
-
-    if not active_opponents:
-        return 1.0
-
-    # Average the expected hand strength of all opponents
-    total_multiplier = 0.0
-    for opp in active_opponents:
-        model = get_opponent_model(opp.name)
-        total_multiplier += model.get_expected_hand_strength_multiplier()
-
-    avg_multiplier = total_multiplier / len(active_opponents)
-
     # If opponents are tight (low multiplier), they likely have stronger hands
     # So our win probability should be adjusted down
     # If opponents are loose (high multiplier), adjust our win probability up
@@ -159,6 +321,75 @@ def analyze_opponents(game: GameState, player: Player):
     return max(0.7, min(1.3, our_adjustment))
 
 
+# The minimum bet and raise sizes as fractions of the pot, floored at the minimum bet
+RaiseSizes = namedtuple('RaiseSizes', ['minimum', 'small', 'third', 'value', 'half', 'large',
+                                       'three_quarters'])
+
+
+@lru_cache(maxsize=64)
+def _raise_sizes(pot, min_bet):
+    """
+    Raise sizes for a given pot: the minimum bet, then 30%, 33%, 40%, 50%,
+    60% and 75% of the pot.
+
+    The pot only changes between bets, so every AI deciding against the same
+    pot shares one computation.
+
+    Returns:
+        RaiseSizes tuple
+    """
+    return RaiseSizes(min_bet, *(max(min_bet, int(pot * fraction))
+                                 for fraction in (0.3, 0.33, 0.4, 0.5, 0.6, 0.75)))
+
+
+# Upper distance-to-23 bound of each betting bucket (strong, good, medium);
+# anything further, including busted, is weak
+_BET_BUCKET_LIMITS = (3, 7, 12)
+
+# Raise sizing by bucket when there is no bet to call:
+# (pot must exceed this many min bets or None, sizes, cap at our credits).
+# Sizes are (RaiseSizes field, roll below) pairs picked by one roll.
+_OPEN_RAISES = (
+    # Strong: 30% small to induce calls, 60% standard, 10% large for value
+    (None, (('minimum', 0.30), ('half', 0.90), ('three_quarters', 1.0)), True),
+    # Good: between min bet and 1/3 pot
+    (None, (('minimum', 0.7), ('third', 1.0)), False),
+    # Medium: bluff with smaller sizing (looks like value bet), if pot is worth it
+    (3, (('minimum', 1.0),), False),
+    # Weak: pure bluff at min bet, only into a bigger pot
+    (5, (('minimum', 1.0),), False),
+)
+
+# Raise chance and sizing by bucket when calling a bet with good pot odds;
+# medium and weak hands just call
+_CALL_RAISES = (
+    (0.50, (('small', 0.4), ('large', 1.0))),  # Strong: 50% raise, else slow-play call
+    (0.25, (('value', 1.0),)),  # Good: occasionally raise for value
+)
+
+
+def _pick_raise_size(sizes, raise_sizes, rand):
+    """
+    Pick a raise size from a (field, roll below) schedule.
+
+    Args:
+        sizes: Tuple of (RaiseSizes field, threshold) pairs; the last
+               threshold is 1.0
+        raise_sizes: RaiseSizes for the current pot
+        rand: random.random; only rolled when there is more than one size
+
+    Returns:
+        Raise amount
+    """
+    if len(sizes) == 1:
+        return getattr(raise_sizes, sizes[0][0])
+    roll = rand()
+    for field, below in sizes:
+        if roll < below:
+            return getattr(raise_sizes, field)
+    return getattr(raise_sizes, sizes[-1][0])
+
+
 def get_simple_ai_action(game: GameState, player: Player) -> dict:
     """
     Generate an AI action with basic distance-to-23 evaluation.
@@ -175,16 +406,33 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
     Returns:
         Action dictionary for execute_player_turn
     """
-    value, is_busted = calculate_hand_value(player.hand)
+    value, is_busted, distance_to_23 = _evaluate_hand(player.hand)
     action = {}
 
-    # Calculate how far we are from the target (23)
+    # Several rolls below; bind the generator once. Rolls stay lazy, so each
+    # path draws exactly as many numbers as before.
+    rand = _random
+
+    # One pass over the active opponents collects everything the betting
+    # decision needs from their models
+    opponent_models = [get_player_model(p) for p in game.active_opponents_of(player)]
+    opponent_stats = [model.snapshot() for model in opponent_models]
+    num_opponents = len(opponent_stats)
+    # Until some opponent has been seen acting, every model reports the
+    # default multiplier (1.0), which leaves our win probability unchanged
+    opponents_observed = any(model.has_observed_actions() for model in opponent_models)
+    if num_opponents:
+        # Transpose into one tuple per stat so each total is a single sum()
+        columns = OpponentSnapshot(*zip(*opponent_stats))
+        total_multiplier = sum(columns.hand_strength_multiplier)
+        total_fold_freq = sum(columns.fold_frequency)
+        total_aggression = sum(columns.aggression_factor)
+
+    # distance_to_23 is how far we are from the target (23); BUST_DISTANCE when busted
     if is_busted:
-        distance_to_23 = float('inf')  # Busted is worst case
         hand_strength = 0.0
         estimated_win_probability = 0.0
     else:
-        distance_to_23 = abs(abs(value) - 23)
         # Hand strength: 0.0 (distance=23) to 1.0 (distance=0)
         # This gives us a normalized measure of how good our hand is
         hand_strength = 1.0 - (distance_to_23 / 23.0)
@@ -198,7 +446,10 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
         base_win_probability = estimate_win_probability(distance_to_23)
 
         # Adjust win probability based on opponent tendencies
-        opponent_adjustment = analyze_opponents(game, player)
+        if opponents_observed:
+            opponent_adjustment = _win_probability_adjustment(total_multiplier / num_opponents)
+        else:
+            opponent_adjustment = 1.0
         estimated_win_probability = base_win_probability * opponent_adjustment
 
         # Clamp to valid probability range
@@ -219,83 +470,49 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
 
     # === BETTING DECISION (using pot odds and opponent modeling) ===
 
+    # Pot-based raise sizes, each at least the minimum bet
+    raise_sizes = _raise_sizes(game.pot, game.min_bet)
+
     # Analyze opponents for bluffing opportunities
-    active_opponents = [p for p in game.players if p != player and not p.has_folded]
     avg_opponent_fold_freq = 0.5  # Default
-    if active_opponents:
-        fold_freqs = [get_opponent_model(opp.name).get_fold_frequency() for opp in active_opponents]
-        avg_opponent_fold_freq = sum(fold_freqs) / len(fold_freqs)
+    if num_opponents:
+        avg_opponent_fold_freq = total_fold_freq / num_opponents
 
     # Bluff more against tight opponents, less against loose
     bluff_multiplier = avg_opponent_fold_freq / 0.5  # 1.0 = average, >1.0 = tight, <1.0 = loose
 
+    # Hand strength bucket: 0 strong (<= 3), 1 good (4-7), 2 medium (8-12), 3 weak
+    bucket = bisect_left(_BET_BUCKET_LIMITS, distance_to_23)
+
     # No bet to call - check or raise based on hand strength
     if amount_to_call == 0:
-        # Strong hand (distance <= 3): mix of aggressive and deceptive plays
-        if distance_to_23 <= 3:
-            # Slow-play occasionally (10-20%) to trap opponents
-            # More likely to slow-play against aggressive opponents
-            slowplay_chance = 0.10
-            if not get_opponent_model(active_opponents[0].name).is_aggressive_player() if active_opponents else False:
-                slowplay_chance = 0.20  # Slow-play more vs aggressive players
-
-            if random.random() < slowplay_chance:
-                # Slow-play: check with strong hand
-                action['bet_action'] = 'call'  # Check
-            else:
-                # Raise (varied sizing for deception)
-                action['bet_action'] = 'raise'
-
-                # Vary raise size: 60% normal, 30% small (trap), 10% large (value)
-                size_roll = random.random()
-                if size_roll < 0.30:  # Small raise to induce calls
-                    raise_size = game.min_bet
-                elif size_roll < 0.90:  # Standard raise
-                    raise_size = max(game.min_bet, int(game.pot * 0.5))
-                else:  # Large raise for value
-                    raise_size = max(game.min_bet, int(game.pot * 0.75))
-
-                action['raise_amount'] = min(raise_size, player.credits)
-
-        # Good hand (distance 4-7): mix of value raises and checks
-        elif distance_to_23 <= 7:
-            # Raise 40% for value, check 60%
-            if random.random() < 0.40:
-                action['bet_action'] = 'raise'
-                # Vary between min bet and 1/3 pot
-                if random.random() < 0.7:
-                    action['raise_amount'] = game.min_bet
-                else:
-                    action['raise_amount'] = max(game.min_bet, int(game.pot * 0.33))
-            else:
-                action['bet_action'] = 'call'  # Check
-
-        # Medium hand (distance 8-12): semi-bluff or check
-        elif distance_to_23 <= 12:
-            # Semi-bluff: bluff with hands that could improve if we draw next round
-            # More likely if we haven't drawn yet (could improve)
-            semi_bluff_value = 1.5 if not player.has_drawn else 1.0
-
-            bluff_chance = 0.15 * bluff_multiplier * semi_bluff_value
-
-            # Only bluff if pot is worth it
-            if random.random() < bluff_chance and game.pot > game.min_bet * 3:
-                action['bet_action'] = 'raise'
-                # Bluff with smaller sizing (looks like value bet)
-                action['raise_amount'] = game.min_bet
-            else:
-                action['bet_action'] = 'call'  # Check
-
-        # Weak hand (distance > 12): usually check, occasional pure bluff
+        # Slow-play a strong hand occasionally (10-20%) to trap opponents,
+        # more often when the opponents are aggressive on average (they're
+        # likely to bet into us)
+        slowplay_chance = 0.10
+        if num_opponents and total_aggression / num_opponents > 0.5:
+            slowplay_chance = 0.20  # Slow-play more vs aggressive players
+
+        # Semi-bluff medium hands that could still improve with a draw, and
+        # pure-bluff weak hands only against tight opponents
+        semi_bluff_value = 1.5 if not player.has_drawn else 1.0
+
+        # Raise when the roll lands in [low, high) for our bucket
+        raise_low, raise_high = (
+            (slowplay_chance, 1.0),  # Strong: raise unless slow-playing
+            (0.0, 0.40),  # Good: raise 40% for value
+            (0.0, 0.15 * bluff_multiplier * semi_bluff_value),  # Medium: semi-bluff
+            (0.0, 0.05 * max(0, (bluff_multiplier - 1.0))),  # Weak: pure bluff
+        )[bucket]
+        pot_gate, sizes, cap_to_credits = _OPEN_RAISES[bucket]
+
+        roll = rand()
+        if raise_low <= roll < raise_high and (pot_gate is None or game.pot > game.min_bet * pot_gate):
+            action['bet_action'] = 'raise'
+            raise_size = _pick_raise_size(sizes, raise_sizes, rand)
+            action['raise_amount'] = min(raise_size, player.credits) if cap_to_credits else raise_size
         else:
-            # Pure bluff: very rare, only against very tight opponents
-            pure_bluff_chance = 0.05 * max(0, (bluff_multiplier - 1.0))  # Only vs tight
-
-            if random.random() < pure_bluff_chance and game.pot > game.min_bet * 5:
-                action['bet_action'] = 'raise'
-                action['raise_amount'] = game.min_bet
-            else:
-                action['bet_action'] = 'call'  # Check
+            action['bet_action'] = 'call'  # Check
 
     # There's a bet to call - use pot odds to decide
     else:
@@ -313,27 +530,15 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
             # Pot odds justify a call
             action['bet_action'] = 'call'
 
-            # Consider raising if hand is strong (deception mix)
-            if distance_to_23 <= 3:
-                # Strong hand: mix of raises and slow-play calls
-                # 50% raise immediately, 50% slow-play call (might check-raise later)
-                if random.random() < 0.50:
+            # Strong and good hands sometimes raise instead (deception mix)
+            if bucket < len(_CALL_RAISES):
+                raise_chance, sizes = _CALL_RAISES[bucket]
+                if rand() < raise_chance:
                     action['bet_action'] = 'raise'
-                    # Vary raise size for deception
-                    if random.random() < 0.4:
-                        raise_size = max(game.min_bet, int(game.pot * 0.3))  # Small
-                    else:
-                        raise_size = max(game.min_bet, int(game.pot * 0.6))  # Large
+                    raise_size = _pick_raise_size(sizes, raise_sizes, rand)
                     action['raise_amount'] = min(raise_size, player.credits)
                 # else: slow-play call (trap)
 
-            # Good hand: occasionally raise for value
-            elif distance_to_23 <= 7:
-                if random.random() < 0.25:  # 25% raise
-                    action['bet_action'] = 'raise'
-                    raise_size = max(game.min_bet, int(game.pot * 0.4))
-                    action['raise_amount'] = min(raise_size, player.credits)
-
         # Marginal situation: call if cheap, fold if expensive
         elif pot_odds_ratio and estimated_win_probability > breakeven_probability - 0.10:
             # Close to breakeven - call if it's cheap relative to our stack
@@ -352,9 +557,8 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
             hero_call_chance = 0.05
 
             # More likely to hero call vs aggressive opponents (they might be bluffing)
-            if active_opponents:
-                avg_aggression = sum(get_opponent_model(p.name).get_aggression_factor()
-                                   for p in active_opponents) / len(active_opponents)
+            if num_opponents:
+                avg_aggression = total_aggression / num_opponents
                 if avg_aggression > 0.6:  # Very aggressive opponents
                     hero_call_chance = 0.12
 
@@ -362,7 +566,7 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
             # 1. Random chance hits
             # 2. Bet is small relative to stack (< 15%)
             # 3. We're not completely busted
-            if (random.random() < hero_call_chance and
+            if (rand() < hero_call_chance and
                 amount_to_call < player.credits * 0.15 and
                 distance_to_23 < 18):
                 action['bet_action'] = 'call'  # Hero call
@@ -421,21 +625,11 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
                     action['draw_action'] = 'discard_pile'
                     action['draw_index'] = draw_idx
             # Otherwise, consider draw pile as fallback
-            elif distance_to_23 > 10:
-                action['draw_action'] = 'draw_pile'
-            elif distance_to_23 > 5 and random.random() < 0.6:
-                action['draw_action'] = 'draw_pile'
-            elif distance_to_23 > 2 and random.random() < 0.3:
-                action['draw_action'] = 'draw_pile'
-        else:
-            # No good visible options, use draw pile if needed
-            if distance_to_23 > 10:
-                action['draw_action'] = 'draw_pile'
-            elif distance_to_23 > 5 and random.random() < 0.6:
-                action['draw_action'] = 'draw_pile'
-            elif distance_to_23 > 2 and random.random() < 0.3:
+            elif _should_draw_from_pile(distance_to_23, rand):
                 action['draw_action'] = 'draw_pile'
-        # If we're very close (distance <= 2), don't draw
+        # No good visible options, use draw pile if needed
+        elif _should_draw_from_pile(distance_to_23, rand):
+            action['draw_action'] = 'draw_pile'
 
     # === DISCARDING DECISION ===
     # Only discard if we have more than 2 cards
@@ -445,12 +639,33 @@ def get_simple_ai_action(game: GameState, player: Player) -> dict:
         if worst_card_index is not None:
             # Discard more aggressively when hand is weak
             discard_chance = 0.7 if distance_to_23 > 10 else 0.4
-            if random.random() < discard_chance:
+            if rand() < discard_chance:
                 action['discard_index'] = worst_card_index
 
     return action
 
 
+def _should_draw_from_pile(distance_to_23, rand):
+    """
+    Decide whether to draw blind from the draw pile.
+
+    Always draw when far from 23 (distance > 10), usually when moderately
+    far, sometimes when close, and never when very close (distance <= 2).
+
+    Args:
+        distance_to_23: Current distance from 23
+        rand: random.random, called only when a roll is needed
+
+    Returns:
+        True to draw from the draw pile
+    """
+    if distance_to_23 > 10:
+        return True
+    if distance_to_23 > 5 and rand() < 0.6:
+        return True
+    return distance_to_23 > 2 and rand() < 0.3
+
+
 def should_play_wheel_of_fortune(game: GameState, player: Player) -> bool:
     """
     Decide if AI should play Wheel of Fortune (Trionfo X) to draw 4 cards.
@@ -462,10 +677,7 @@ def should_play_wheel_of_fortune(game: GameState, player: Player) -> bool:
     Returns:
         True if AI should play Wheel of Fortune
     """
-    from sabacc_game import calculate_hand_value
-
-    value, is_busted = calculate_hand_value(player.hand)
-    distance = abs(abs(value) - 23) if not is_busted else float('inf')
+    value, is_busted, distance = _evaluate_hand(player.hand)
 
     # Play if hand is weak (distance > 8) or busted
     if distance > 8 or is_busted:
@@ -490,29 +702,55 @@ def choose_wheel_of_fortune_cards(current_hand, drawn_cards):
     Returns:
         List of cards to keep
     """
-    from sabacc_game import calculate_hand_value
-    from itertools import combinations
+    # Hand values are additive per card, so sum each card's components once
+    # and only resolve aces/The Lovers for each candidate subset
+    hand = _hand_view(current_hand)
+    base_value, base_aces, base_lovers = hand.value, hand.aces, hand.lovers
+    drawn = _hand_view(drawn_cards)
 
     # Current hand value
-    current_value, current_busted = calculate_hand_value(current_hand)
-    current_distance = abs(abs(current_value) - 23) if not current_busted else float('inf')
-
-    best_kept_cards = []
+    _, _, current_distance = _evaluate_components(base_value, base_aces, base_lovers)
+
+    # Component sums for every subset of the drawn cards, keyed by bitmask.
+    # Each subset is a smaller one plus its lowest card, so it costs one add.
+    num_drawn = len(drawn_cards)
+    subset_sums = [(base_value, base_aces, base_lovers)] * (1 << num_drawn)
+    for mask in range(1, 1 << num_drawn):
+        low_bit = mask & -mask
+        test_value, test_aces, test_lovers = subset_sums[mask ^ low_bit]
+        i = low_bit.bit_length() - 1
+        subset_sums[mask] = (test_value + drawn.card_values[i],
+                             test_aces + drawn.card_aces[i],
+                             test_lovers + drawn.card_lovers[i])
+
+    best_mask = 0
     best_distance = current_distance
 
     # Try all possible combinations of keeping 0-4 cards
-    for num_to_keep in range(len(drawn_cards) + 1):
-        for cards_to_keep in combinations(drawn_cards, num_to_keep):
-            test_hand = current_hand + list(cards_to_keep)
-            test_value, test_busted = calculate_hand_value(test_hand)
-            test_distance = abs(abs(test_value) - 23) if not test_busted else float('inf')
+    for mask in _subset_masks(num_drawn):
+        _, _, test_distance = _evaluate_components(*subset_sums[mask])
+
+        # Better than current best?
+        if test_distance < best_distance:
+            best_distance = test_distance
+            best_mask = mask
+
+    return [card for i, card in enumerate(drawn_cards) if best_mask >> i & 1]
 
-            # Better than current best?
-            if test_distance < best_distance:
-                best_distance = test_distance
-                best_kept_cards = list(cards_to_keep)
 
-    return best_kept_cards
+@lru_cache(maxsize=None)
+def _subset_masks(count):
+    """
+    Every subset of `count` items as a bitmask (bit i = item i kept).
+
+    Ordered the way itertools.combinations() would produce them - smallest
+    subsets first, then by index - so ties resolve to the same subset.
+    """
+    def combination_order(mask):
+        indices = [i for i in range(count) if mask >> i & 1]
+        return (len(indices), indices)
+
+    return tuple(sorted(range(1 << count), key=combination_order))
 
 
 def should_play_hermit(game: GameState, player: Player) -> bool:
@@ -527,18 +765,14 @@ def should_play_hermit(game: GameState, player: Player) -> bool:
     Returns:
         True if AI should play The Hermit
     """
-    from sabacc_game import calculate_hand_value
-
     # Get active opponents
-    active_opponents = [p for p in game.players
-                       if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+    active_opponents = game.active_opponents_of(player, include_hermits=False)
 
     if not active_opponents:
         return False
 
     # Check AI's hand strength
-    value, is_busted = calculate_hand_value(player.hand)
-    distance = abs(abs(value) - 23) if not is_busted else float('inf')
+    value, is_busted, distance = _evaluate_hand(player.hand)
 
     # Don't play if hand is terrible
     if distance > 12 or is_busted:
@@ -553,7 +787,7 @@ def should_play_hermit(game: GameState, player: Player) -> bool:
     # Avoid pressure and special effects
     if distance <= 5:
         aggressive_count = sum(1 for opp in active_opponents
-                             if get_opponent_model(opp.name).is_aggressive_player())
+                             if get_player_model(opp).is_aggressive_player())
         if aggressive_count >= 2:
             return True
 
@@ -561,8 +795,7 @@ def should_play_hermit(game: GameState, player: Player) -> bool:
     # Lock it in and go to showdown
     if distance <= 3 and game.pot > game.min_bet * 10:
         # 30% chance to hermit with strong hand and big pot
-        import random
-        if random.random() < 0.3:
+        if _random() < 0.3:
             return True
 
     return False
@@ -580,18 +813,14 @@ def should_play_chariot(game: GameState, player: Player) -> bool:
     Returns:
         True if AI should play The Chariot
     """
-    from sabacc_game import calculate_hand_value
-
     # Get active opponents
-    active_opponents = [p for p in game.players
-                       if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+    active_opponents = game.active_opponents_of(player, include_hermits=False)
 
     if not active_opponents:
         return False
 
     # Check AI's hand strength
-    value, is_busted = calculate_hand_value(player.hand)
-    distance = abs(abs(value) - 23) if not is_busted else float('inf')
+    value, is_busted, distance = _evaluate_hand(player.hand)
 
     # Only play if AI has good hand (distance <= 7)
     if distance > 7:
@@ -623,18 +852,14 @@ def should_play_hierophant(game: GameState, player: Player) -> bool:
     Returns:
         True if AI should play The Hierophant
     """
-    from sabacc_game import calculate_hand_value
-
     # Get active opponents
-    active_opponents = [p for p in game.players
-                       if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+    active_opponents = game.active_opponents_of(player, include_hermits=False)
 
     if not active_opponents:
         return False
 
     # Check AI's hand strength
-    value, is_busted = calculate_hand_value(player.hand)
-    distance = abs(abs(value) - 23) if not is_busted else float('inf')
+    value, is_busted, distance = _evaluate_hand(player.hand)
 
     # Only play if AI has decent hand (otherwise revealing helps opponents)
     if distance > 10:
@@ -645,7 +870,7 @@ def should_play_hierophant(game: GameState, player: Player) -> bool:
     loose_count = 0
 
     for opp in active_opponents:
-        model = get_opponent_model(opp.name)
+        model = get_player_model(opp)
         if model.is_aggressive_player():
             aggressive_count += 1
         if model.is_loose_player():
@@ -679,8 +904,7 @@ def should_play_emperor(game: GameState, player: Player) -> bool:
         True if AI should play The Emperor
     """
     # Get valid targets
-    targets = [p for p in game.players
-               if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+    targets = game.active_opponents_of(player, include_hermits=False)
 
     if not targets:
         return False
@@ -713,19 +937,16 @@ def choose_emperor_target(game: GameState, player: Player) -> 'Player':
     Returns:
         The chosen target player
     """
-    import random
-
-    targets = [p for p in game.players
-               if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+    targets = game.active_opponents_of(player, include_hermits=False)
 
     if not targets:
         return None
 
     # Strategy 1: Target player with fewest credits (most likely to fold)
-    targets_by_credits = sorted(targets, key=lambda p: p.credits)
+    targets_by_credits = sorted(targets, key=_credits)
 
     # 70% chance to target weakest stack
-    if random.random() < 0.7:
+    if _random() < 0.7:
         return targets_by_credits[0]
 
     # 30% chance to target a random player (unpredictable)
@@ -744,10 +965,7 @@ def should_play_magician(game: GameState, player: Player) -> bool:
     Returns:
         True if AI should play The Magician
     """
-    from sabacc_game import calculate_hand_value
-
-    value, is_busted = calculate_hand_value(player.hand)
-    distance = abs(abs(value) - 23) if not is_busted else float('inf')
+    value, is_busted, distance = _evaluate_hand(player.hand)
 
     # Don't play if hand is already good
     if distance <= 5:
@@ -781,24 +999,25 @@ def arrange_magician_cards(game: GameState, player: Player, top_4_cards: list) -
     Returns:
         Arranged list of 4 cards (index 0 = top of deck)
     """
-    from sabacc_game import calculate_hand_value
-
-    current_value, current_busted = calculate_hand_value(player.hand)
-    current_distance = abs(abs(current_value) - 23) if not current_busted else float('inf')
+    # Every candidate hand is our hand plus one card, so sum our cards once
+    hand = _hand_view(player.hand)
+    hand_value, hand_aces, hand_lovers = hand.value, hand.aces, hand.lovers
+    _, _, current_distance = _evaluate_components(hand_value, hand_aces, hand_lovers)
 
     # Score each card by how much it would improve our hand
     card_scores = []
     for card in top_4_cards:
-        test_hand = player.hand + [card]
-        test_value, test_busted = calculate_hand_value(test_hand)
-        test_distance = abs(abs(test_value) - 23) if not test_busted else float('inf')
+        card_value, card_aces, card_lovers = CARD_COMPONENTS[card]
+        _, _, test_distance = _evaluate_components(hand_value + card_value,
+                                                   hand_aces + card_aces,
+                                                   hand_lovers + card_lovers)
 
         # Lower distance is better, so improvement is negative delta
         improvement = current_distance - test_distance
         card_scores.append((card, improvement))
 
     # Sort by improvement (best first)
-    card_scores.sort(key=lambda x: x[1], reverse=True)
+    card_scores.sort(key=itemgetter(1), reverse=True)
 
     # Return cards in order: best on top
     return [card for card, score in card_scores]
@@ -819,6 +1038,14 @@ def estimate_win_probability(distance_to_23):
     Returns:
         Estimated win probability (0.0 to 1.0)
     """
+    probability = _WIN_PROBABILITY_BY_DISTANCE.get(distance_to_23)
+    if probability is None:
+        return _win_probability_for_distance(distance_to_23)
+    return probability
+
+
+def _win_probability_for_distance(distance_to_23):
+    """Piecewise win probability behind estimate_win_probability()"""
     if distance_to_23 == 0:
         return 0.90  # Perfect hand, but could still lose to ties
 
@@ -840,6 +1067,29 @@ def estimate_win_probability(distance_to_23):
     return 0.05  # Very weak hand
 
 
+# Every distance a non-busted hand can have (0-23), precomputed so each
+# decision does one lookup instead of walking the thresholds
+_WIN_PROBABILITY_BY_DISTANCE = {
+    distance: _win_probability_for_distance(distance) for distance in range(24)
+}
+
+
+def _first_of_each_kind(view):
+    """
+    Index and components of the first card with each distinct set of components.
+
+    Args:
+        view: HandView of the cards
+
+    Returns:
+        List of (index, (value, aces, lovers)) in card order
+    """
+    first_index = {}
+    for i, components in enumerate(zip(view.card_values, view.card_aces, view.card_lovers)):
+        first_index.setdefault(components, i)
+    return [(i, components) for components, i in first_index.items()]
+
+
 def evaluate_community_swaps(hand, community_cards):
     """
     Evaluate all possible swaps between hand cards and community cards.
@@ -857,33 +1107,45 @@ def evaluate_community_swaps(hand, community_cards):
     if not community_cards or not hand:
         return None
 
-    current_value, current_busted = calculate_hand_value(hand)
-    current_distance = abs(abs(current_value) - 23) if not current_busted else float('inf')
+    current_value, current_busted, current_distance = _evaluate_hand(hand)
+    if current_distance == 0:
+        return None  # Already exactly 23; no swap can strictly improve on it
 
     best_hand_idx = None
     best_comm_idx = None
     best_distance = current_distance
 
-    # Try every possible swap
-    for hand_idx in range(len(hand)):
-        for comm_idx in range(len(community_cards)):
-            # Simulate the swap
-            simulated_hand = hand.copy()
-            card_to_remove = simulated_hand[hand_idx]
-            card_to_add = community_cards[comm_idx]
+    # A swap only changes two cards, so score it from the hand's component
+    # sum minus the card given up plus the card taken
+    view = _hand_view(hand)
+    community = _hand_view(community_cards)
+
+    # Cards with the same components (e.g. the four suits of a rank) score
+    # identically, and only a strictly better swap replaces the best, so
+    # only the first card of each kind on either side needs trying
+    hand_cards = _first_of_each_kind(view)
+    community_cards_by_kind = _first_of_each_kind(community)
 
-            # Perform swap
-            simulated_hand[hand_idx] = card_to_add
+    # Try every possible swap
+    for hand_idx, (removed_value, removed_aces, removed_lovers) in hand_cards:
+        kept_value = view.value - removed_value
+        kept_aces = view.aces - removed_aces
+        kept_lovers = view.lovers - removed_lovers
 
-            # Evaluate new hand
-            test_value, test_busted = calculate_hand_value(simulated_hand)
-            test_distance = abs(abs(test_value) - 23) if not test_busted else float('inf')
+        for comm_idx, (added_value, added_aces, added_lovers) in community_cards_by_kind:
+            # Evaluate the hand with the swap performed
+            _, _, test_distance = _evaluate_components(kept_value + added_value,
+                                                       kept_aces + added_aces,
+                                                       kept_lovers + added_lovers)
 
             # Is this swap better than what we have?
             if test_distance < best_distance:
                 best_distance = test_distance
                 best_hand_idx = hand_idx
                 best_comm_idx = comm_idx
+                if best_distance == 0:
+                    # Nothing beats exactly 23; later ties wouldn't replace it
+                    return (best_hand_idx, best_comm_idx, best_distance)
 
     if best_hand_idx is not None:
         return (best_hand_idx, best_comm_idx, best_distance)
@@ -908,46 +1170,50 @@ def evaluate_discard_pile_draws(hand, discard_pile):
     if not discard_pile:
         return None
 
-    current_value, current_busted = calculate_hand_value(hand)
-    current_distance = abs(abs(current_value) - 23) if not current_busted else float('inf')
+    current_value, current_busted, current_distance = _evaluate_hand(hand)
 
     best_draw_index = None
     best_expected_distance = current_distance
 
+    # Drawing from index i gives our hand plus the pile from i upwards, so
+    # keep one scratch hand and running totals for it, dropping pile[i] in
+    # place after each index instead of building a new hand per draw. The
+    # pile goes in reversed so pile[i] is always the last card: an O(1) pop.
+    scratch = hand + discard_pile[::-1]
+    view = _hand_view(scratch)
+    test_value, test_aces, test_lovers = view.value, view.aces, view.lovers
+
     # Try each possible draw from the discard pile
     # Index i means: take card[i], card[i+1], ..., card[len-1]
     for draw_index in range(len(discard_pile)):
-        # Cards we would take (draw_index and everything above it)
-        cards_to_take = discard_pile[draw_index:]
-
-        # Simulate adding these cards to our hand
-        simulated_hand = hand + cards_to_take
-
-        # Calculate value with new cards
-        test_value, test_busted = calculate_hand_value(simulated_hand)
-        test_distance = abs(abs(test_value) - 23) if not test_busted else float('inf')
+        # Calculate value with the new cards
+        _, _, test_distance = _evaluate_components(test_value, test_aces, test_lovers)
+        simulated_size = len(scratch)
 
         # Now, if we took multiple cards, we might want to discard some
         # Simulate optimal discarding to see the best possible outcome
-        if len(simulated_hand) > 2:
-            # Try to optimize by discarding worst cards
-            # We can discard back down to 2 cards if we want
-            best_distance_after_discard = test_distance
-
+        # (exactly 23 can't be improved on)
+        if simulated_size > 2 and test_distance > 0:
             # Try discarding 1, 2, or 3 cards to see if it helps
-            for num_discards in range(1, min(4, len(simulated_hand) - 1)):
-                optimized_hand = optimize_hand_by_discarding(simulated_hand, num_discards)
-                if optimized_hand:
-                    opt_value, opt_busted = calculate_hand_value(optimized_hand)
-                    opt_distance = abs(abs(opt_value) - 23) if not opt_busted else float('inf')
-                    best_distance_after_discard = min(best_distance_after_discard, opt_distance)
-
-            test_distance = best_distance_after_discard
+            # We can discard back down to 2 cards if we want
+            hand_key = tuple(sorted(scratch))
+            max_discards = min(3, simulated_size - 2)
+            test_distance = min(test_distance,
+                                _best_distance_after_discarding(hand_key, max_discards))
 
         # Is this draw better than what we have now?
         if test_distance < best_expected_distance:
             best_expected_distance = test_distance
             best_draw_index = draw_index
+            if best_expected_distance == 0:
+                break  # Nothing beats exactly 23; later ties wouldn't replace it
+
+        # Drop pile[draw_index] for the next, smaller draw
+        scratch.pop()
+        pile_pos = len(scratch)
+        test_value -= view.card_values[pile_pos]
+        test_aces -= view.card_aces[pile_pos]
+        test_lovers -= view.card_lovers[pile_pos]
 
     if best_draw_index is not None:
         return (best_draw_index, best_expected_distance)
@@ -973,24 +1239,72 @@ def optimize_hand_by_discarding(hand, num_to_discard):
         return hand
 
     # For small numbers, try all combinations
-    from itertools import combinations
+    best_discarded = None
+    best_distance = BUST_DISTANCE
+
+    # Score each candidate as the hand's totals minus the discarded cards, so
+    # a candidate costs num_to_discard subtractions however big the hand is.
+    # Discard sets in reverse order match the kept-card combinations in
+    # order, which keeps the first-found winner among ties.
+    view = _hand_view(hand)
+    card_values, card_aces, card_lovers = view.card_values, view.card_aces, view.card_lovers
+    discard_sets = reversed(list(combinations(range(len(hand)), num_to_discard)))
+
+    for discarded in discard_sets:
+        test_value, test_aces, test_lovers = view.value, view.aces, view.lovers
+        for i in discarded:
+            test_value -= card_values[i]
+            test_aces -= card_aces[i]
+            test_lovers -= card_lovers[i]
+        _, _, test_distance = _evaluate_components(test_value, test_aces, test_lovers)
 
-    best_hand = None
-    best_distance = float('inf')
+        if test_distance < best_distance:
+            best_distance = test_distance
+            best_discarded = discarded
+            if best_distance == 0:
+                break  # Exactly 23 can't be beaten, only tied
 
-    # Generate all possible hands by removing num_to_discard cards
-    hand_size_after = len(hand) - num_to_discard
+    if best_discarded is None:
+        return None
+    return [card for i, card in enumerate(hand) if i not in best_discarded]
 
-    for kept_cards in combinations(hand, hand_size_after):
-        test_hand = list(kept_cards)
-        test_value, test_busted = calculate_hand_value(test_hand)
-        test_distance = abs(abs(test_value) - 23) if not test_busted else float('inf')
 
-        if test_distance < best_distance:
-            best_distance = test_distance
-            best_hand = test_hand
+@lru_cache(maxsize=1024)
+def _best_distance_after_discarding(hand_key, max_discards):
+    """
+    Distance to 23 of the best hand left after discarding 1 to max_discards cards.
 
-    return best_hand
+    Scores every discard set of every size in one pass over the hand's
+    component totals, rather than running optimize_hand_by_discarding()
+    once per size and re-scoring each winner. Memoized on the sorted cards:
+    the AI re-runs the same discard-pile search on every turn until the pile
+    or its hand changes.
+
+    Args:
+        hand_key: Sorted tuple of the hand's cards
+        max_discards: Most cards to discard (less than len(hand_key))
+
+    Returns:
+        Best distance, or BUST_DISTANCE if every such hand is busted
+    """
+    view = _hand_view_of(hand_key)
+    card_values, card_aces, card_lovers = view.card_values, view.card_aces, view.card_lovers
+    best_distance = BUST_DISTANCE
+
+    for num_to_discard in range(1, max_discards + 1):
+        for discarded in combinations(range(len(hand_key)), num_to_discard):
+            test_value, test_aces, test_lovers = view.value, view.aces, view.lovers
+            for i in discarded:
+                test_value -= card_values[i]
+                test_aces -= card_aces[i]
+                test_lovers -= card_lovers[i]
+            _, _, test_distance = _evaluate_components(test_value, test_aces, test_lovers)
+            if test_distance < best_distance:
+                best_distance = test_distance
+                if best_distance == 0:
+                    return 0  # Exactly 23 can't be beaten
+
+    return best_distance
 
 
 def find_worst_card_to_discard(hand) -> int:
@@ -1003,22 +1317,23 @@ def find_worst_card_to_discard(hand) -> int:
     Returns:
         Index of the worst card to discard, or None if no good discard
     """
-    current_value, current_busted = calculate_hand_value(hand)
-    current_distance = abs(abs(current_value) - 23) if not current_busted else float('inf')
+    current_value, current_busted, current_distance = _evaluate_hand(hand)
 
     best_discard_index = None
     best_distance_after_discard = current_distance
 
-    # Try discarding each card and see which gives the best result
-    for i in range(len(hand)):
-        # Create a copy of hand without this card
-        test_hand = hand[:i] + hand[i+1:]
+    # Don't discard if it leaves us with no cards
+    if len(hand) < 2:
+        return None
 
-        if len(test_hand) == 0:  # Don't discard if it leaves us with no cards
-            continue
+    # Score each one-card-short hand as the full hand minus that card
+    view = _hand_view(hand)
 
-        test_value, test_busted = calculate_hand_value(test_hand)
-        test_distance = abs(abs(test_value) - 23) if not test_busted else float('inf')
+    # Try discarding each card and see which gives the best result
+    for i in range(len(hand)):
+        _, _, test_distance = _evaluate_components(view.value - view.card_values[i],
+                                                   view.aces - view.card_aces[i],
+                                                   view.lovers - view.card_lovers[i])
 
         # If discarding this card improves our distance to 23, remember it
         if test_distance < best_distance_after_discard:
@@ -1028,6 +1343,90 @@ def find_worst_card_to_discard(hand) -> int:
     return best_discard_index
 
 
+def _map_states(search, executor, *columns):
+    """
+    Run a hand search over many independent game states.
+
+    Args:
+        search: Module-level search function to call per state
+        executor: Optional concurrent.futures executor to spread the states
+            over; None runs them in this process, sharing the memo caches
+        *columns: One sequence per search argument, all the same length
+
+    Returns:
+        List of results, in state order
+    """
+    if executor is None:
+        return list(map(search, *columns))
+    # Batch states per task so process pools don't pickle one tiny call at a time
+    chunksize = max(1, len(columns[0]) // 32)
+    return list(executor.map(search, *columns, chunksize=chunksize))
+
+
+def evaluate_community_swaps_batch(hands, communities, executor=None):
+    """
+    evaluate_community_swaps() for many independent (hand, community) states.
+
+    Args:
+        hands: Sequence of hands
+        communities: Sequence of community card lists, one per hand
+        executor: Optional executor (e.g. a ProcessPoolExecutor) to run on
+
+    Returns:
+        List of evaluate_community_swaps() results, in state order
+    """
+    return _map_states(evaluate_community_swaps, executor, hands, communities)
+
+
+def evaluate_discard_pile_draws_batch(hands, discard_piles, executor=None):
+    """
+    evaluate_discard_pile_draws() for many independent (hand, pile) states.
+
+    Args:
+        hands: Sequence of hands
+        discard_piles: Sequence of discard piles, one per hand
+        executor: Optional executor (e.g. a ProcessPoolExecutor) to run on
+
+    Returns:
+        List of evaluate_discard_pile_draws() results, in state order
+    """
+    return _map_states(evaluate_discard_pile_draws, executor, hands, discard_piles)
+
+
+def find_worst_card_to_discard_batch(hands, executor=None):
+    """
+    find_worst_card_to_discard() for many independent hands.
+
+    Args:
+        hands: Sequence of hands
+        executor: Optional executor (e.g. a ProcessPoolExecutor) to run on
+
+    Returns:
+        List of find_worst_card_to_discard() results, in state order
+    """
+    return _map_states(find_worst_card_to_discard, executor, hands)
+
+
+# Trionfi numbers The Hanged Man weighs blocking, by how much they matter to us.
+# Trionfi that directly target/harm players - high priority to block
+_TRIONFI_TARGETED = frozenset({
+    4,   # The Emperor - forces ante/discard/fold, likely targets us
+    5,   # The Hierophant - forces reveal or fold
+    7,   # The Chariot - forces discard or fold
+})
+
+# Powerful beneficial effects that can swing the game
+_TRIONFI_POWERFUL_BENEFICIAL = frozenset({
+    1,   # The Magician - rearranges deck
+    10,  # Wheel of Fortune - draw 4, keep what you want
+})
+
+# Moderate effects - consider blocking based on game state
+_TRIONFI_MODERATE = frozenset({
+    9,   # The Hermit - withdraw from betting
+})
+
+
 def should_play_hanged_man(game: GameState, hanged_man_player: Player, acting_player: Player, trionfi) -> bool:
     """
     Decide whether to play The Hanged Man to nullify an opponent's Trionfi effect.
@@ -1042,52 +1441,33 @@ def should_play_hanged_man(game: GameState, hanged_man_player: Player, acting_pl
         True if The Hanged Man should be played, False otherwise
     """
     # Get our hand evaluation
-    our_value, our_busted = calculate_hand_value(hanged_man_player.hand)
-    our_distance = abs(abs(our_value) - 23) if not our_busted else float('inf')
-
-    # Trionfi that directly target/harm players - high priority to block
-    targeted_effects = {
-        4,   # The Emperor - forces ante/discard/fold, likely targets us
-        5,   # The Hierophant - forces reveal or fold
-        7,   # The Chariot - forces discard or fold
-    }
-
-    # Powerful beneficial effects that can swing the game
-    powerful_beneficial = {
-        1,   # The Magician - rearranges deck
-        10,  # Wheel of Fortune - draw 4, keep what you want
-    }
-
-    # Moderate effects - consider blocking based on game state
-    moderate_effects = {
-        9,   # The Hermit - withdraw from betting
-    }
+    our_value, our_busted, our_distance = _evaluate_hand(hanged_man_player.hand)
 
     # Always block targeted effects (they likely harm us)
-    if trionfi.number in targeted_effects:
+    if trionfi.number in _TRIONFI_TARGETED:
         # Block with 80% probability (some randomness to avoid predictability)
-        return random.random() < 0.8
+        return _random() < 0.8
 
     # Block powerful beneficial effects if opponent is in a weak position
     # (they're trying to recover/improve)
-    if trionfi.number in powerful_beneficial:
+    if trionfi.number in _TRIONFI_POWERFUL_BENEFICIAL:
         # If opponent seems desperate (low credits, likely weak hand based on betting)
         if acting_player.credits < game.min_bet * 10:  # Very low on credits
             # Block with 70% probability
-            return random.random() < 0.7
+            return _random() < 0.7
 
         # If we're in a strong position (good hand, good credits)
         if our_distance <= 5 and hanged_man_player.credits > game.pot:
             # Block with 50% probability to prevent opponent improvement
-            return random.random() < 0.5
+            return _random() < 0.5
 
         # Otherwise, don't waste The Hanged Man
         return False
 
     # For moderate effects, rarely block (save The Hanged Man for important moments)
-    if trionfi.number in moderate_effects:
+    if trionfi.number in _TRIONFI_MODERATE:
         # Only block 10% of the time
-        return random.random() < 0.1
+        return _random() < 0.1
 
     # For other effects, don't waste The Hanged Man
     return False
@@ -1108,14 +1488,18 @@ def should_give_away_devil(game: GameState, player: Player) -> bool:
     # Almost always give it away!
 
     # Calculate our current hand value with The Devil
-    our_value, our_busted = calculate_hand_value(player.hand)
-
-    # Try removing The Devil and see if it helps
-    hand_without_devil = [c for c in player.hand if c != ('15', 'T')]
-    value_without, busted_without = calculate_hand_value(hand_without_devil)
-
-    distance_with = abs(abs(our_value) - 23) if not our_busted else float('inf')
-    distance_without = abs(abs(value_without) - 23) if not busted_without else float('inf')
+    our_value, our_busted, distance_with = _evaluate_hand(player.hand)
+
+    # Try removing The Devil and see if it helps (cards are unique, so
+    # slicing out its one copy matches filtering the whole hand)
+    hand = player.hand
+    try:
+        devil_index = hand.index(DEVIL_CARD)
+    except ValueError:
+        hand_without_devil = hand
+    else:
+        hand_without_devil = hand[:devil_index] + hand[devil_index + 1:]
+    value_without, busted_without, distance_without = _evaluate_hand(hand_without_devil)
 
     # If removing The Devil improves our distance, give it away
     if distance_without < distance_with:
@@ -1123,7 +1507,7 @@ def should_give_away_devil(game: GameState, player: Player) -> bool:
 
     # Edge case: if The Devil somehow helps us (rare symmetric case where -15 helps),
     # still give it away 50% of the time to avoid being predictable
-    return random.random() < 0.5
+    return _random() < 0.5
 
 
 def should_play_universe(game: GameState, player: Player) -> bool:
@@ -1144,8 +1528,7 @@ def should_play_universe(game: GameState, player: Player) -> bool:
     if len(game.draw_pile.cards) < 6:
         return False
 
-    our_value, our_busted = calculate_hand_value(player.hand)
-    our_distance = abs(abs(our_value) - 23) if not our_busted else float('inf')
+    our_value, our_busted, our_distance = _evaluate_hand(player.hand)
 
     # Only valuable if we're likely to draw from the draw pile
     # Play more often if hand is weak/moderate and we haven't drawn yet
@@ -1153,20 +1536,20 @@ def should_play_universe(game: GameState, player: Player) -> bool:
         # Weak hand (distance > 8) - likely to draw, information is valuable
         if our_distance > 8 or our_busted:
             # Play 40% of the time with weak hand (helps decide if draw pile is good)
-            return random.random() < 0.4
+            return _random() < 0.4
 
         # Moderate hand (distance 5-8) - might draw
         if 5 < our_distance <= 8:
             # Play 20% of the time with moderate hand
-            return random.random() < 0.2
+            return _random() < 0.2
 
         # Strong hand (distance <= 5) - unlikely to draw, less valuable
         # Play 5% of the time (might still be useful to know what opponents could draw)
-        return random.random() < 0.05
+        return _random() < 0.05
     else:
         # Already drawn - information is less valuable
         # Only play 10% of the time to see what opponents might draw
-        return random.random() < 0.1
+        return _random() < 0.1
 
 
 def should_play_judgment(game: GameState, player: Player) -> bool:
@@ -1183,8 +1566,7 @@ def should_play_judgment(game: GameState, player: Player) -> bool:
     Returns:
         True if should play The Last Judgment, False otherwise
     """
-    our_value, our_busted = calculate_hand_value(player.hand)
-    our_distance = abs(abs(our_value) - 23) if not our_busted else float('inf')
+    our_value, our_busted, our_distance = _evaluate_hand(player.hand)
 
     # Never play if we're busted or have a weak hand
     if our_busted or our_distance > 7:
@@ -1196,29 +1578,49 @@ def should_play_judgment(game: GameState, player: Player) -> bool:
         # Consider pot size - only worth it if pot is significant
         if game.pot >= game.min_bet * 5:
             # Play 70% of the time with strong hand and good pot
-            return random.random() < 0.7
+            return _random() < 0.7
         else:
             # Smaller pot, play less often
-            return random.random() < 0.3
+            return _random() < 0.3
 
     # Good hand (distance 4-7): sometimes play
     # Depends on pot size and opponent count
     if our_distance <= 7:
-        active_opponents = [p for p in game.players if p != player and not p.has_folded]
+        active_opponents = game.active_opponents_of(player)
 
         # More opponents = more likely someone could improve
         # Play more often with more opponents
         if len(active_opponents) >= 3:
             # Multiple opponents, higher chance someone improves
             if game.pot >= game.min_bet * 5:
-                return random.random() < 0.4
+                return _random() < 0.4
         elif len(active_opponents) == 2:
             if game.pot >= game.min_bet * 5:
-                return random.random() < 0.2
+                return _random() < 0.2
 
     return False
 
 
+def _average_aggression(opponents):
+    """
+    Mean aggression factor of some opponents, 0.5 if there are none.
+
+    Reads each opponent's cached model snapshot, which is only recomputed
+    after that opponent acts again, so repeated Trionfi checks within a turn
+    don't redo the per-opponent stats.
+
+    Args:
+        opponents: List of opponent Players
+
+    Returns:
+        Average aggression factor
+    """
+    if not opponents:
+        return 0.5
+    total = sum(get_player_model(p).snapshot().aggression_factor for p in opponents)
+    return total / len(opponents)
+
+
 def should_play_sun(game: GameState, player: Player) -> bool:
     """
     Decide whether to play The Sun to force all hands face up.
@@ -1236,8 +1638,7 @@ def should_play_sun(game: GameState, player: Player) -> bool:
     if game.hands_face_up:
         return False
 
-    our_value, our_busted = calculate_hand_value(player.hand)
-    our_distance = abs(abs(our_value) - 23) if not our_busted else float('inf')
+    our_value, our_busted, our_distance = _evaluate_hand(player.hand)
 
     # Only play if we have a strong hand (distance <= 5)
     # Playing with a weak hand reveals our weakness
@@ -1245,29 +1646,23 @@ def should_play_sun(game: GameState, player: Player) -> bool:
         return False
 
     # Check if there are aggressive opponents who might be bluffing
-    active_opponents = [p for p in game.players if p != player and not p.has_folded]
+    active_opponents = game.active_opponents_of(player)
     if not active_opponents:
         return False
 
     # Check opponent aggression
-    avg_aggression = 0.5
-    if active_opponents:
-        from sabacc_ai import get_opponent_model
-        aggression_values = [get_opponent_model(p.name).get_aggression_factor()
-                           for p in active_opponents]
-        if aggression_values:
-            avg_aggression = sum(aggression_values) / len(aggression_values)
+    avg_aggression = _average_aggression(active_opponents)
 
     # Play more often vs aggressive opponents (they might be bluffing)
     if avg_aggression > 0.6:
         # Play 60% of time vs aggressive opponents
-        return random.random() < 0.6
+        return _random() < 0.6
     elif avg_aggression > 0.4:
         # Play 30% of time vs moderate opponents
-        return random.random() < 0.3
+        return _random() < 0.3
     else:
         # Play 10% of time vs passive opponents (less bluffing expected)
-        return random.random() < 0.1
+        return _random() < 0.1
 
 
 def should_play_moon(game: GameState, player: Player) -> bool:
@@ -1283,22 +1678,21 @@ def should_play_moon(game: GameState, player: Player) -> bool:
     Returns:
         True if should play The Moon, False otherwise
     """
-    our_value, our_busted = calculate_hand_value(player.hand)
-    our_distance = abs(abs(our_value) - 23) if not our_busted else float('inf')
+    our_value, our_busted, our_distance = _evaluate_hand(player.hand)
 
     # If hand is weak (distance > 8) or busted, adding more community cards helps
     if our_distance > 8 or our_busted:
         # Play 70% of the time when weak
-        return random.random() < 0.7
+        return _random() < 0.7
 
     # If hand is moderate (distance 5-8), sometimes play for more options
     if 5 < our_distance <= 8:
         # Play 30% of the time
-        return random.random() < 0.3
+        return _random() < 0.3
 
     # If hand is strong (distance <= 5), rarely play The Moon
     # (don't need more options, current hand is good)
-    return random.random() < 0.1
+    return _random() < 0.1
 
 
 def choose_devil_target(game: GameState, player: Player, eligible_targets: list) -> Player:
@@ -1321,10 +1715,10 @@ def choose_devil_target(game: GameState, player: Player, eligible_targets: list)
     # If we have opponent models, consider aggression/strength
     # For now, target the richest player
 
-    richest_player = max(eligible_targets, key=lambda p: p.credits)
+    richest_player = max(eligible_targets, key=_credits)
 
     # Add some randomness (70% target richest, 30% random)
-    if random.random() < 0.7:
+    if _random() < 0.7:
         return richest_player
     else:
         return random.choice(eligible_targets)
\ No newline at end of file
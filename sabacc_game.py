@@ -6,12 +6,19 @@ A card game blending poker betting, rummy-style draws, and blackjack scoring
 
 import random
 import os
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 # Type aliases for clarity
 Card = Tuple[str, str]  # (rank, suit)
 Hand = List[Card]
 
+# Suit display names and final tiebreaker ranking (Wands > Cups > Swords > Disks)
+SUIT_NAMES = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'D': 'Disks', 'T': 'Trionfi'}
+SUIT_RANKING = {'W': 4, 'C': 3, 'S': 2, 'D': 1, 'T': 0}
+
+# The Devil (Trionfi XV, -15): passed to another player at the start of a turn
+DEVIL_CARD: Card = ('15', 'T')
+
 
 def load_player_names() -> List[str]:
     """
@@ -57,7 +64,12 @@ def get_random_opponent_names(count: int) -> List[str]:
 
 
 class Deck:
-    """Manages the 78-card Tarot deck"""
+    """
+    Manages the 78-card Tarot deck.
+
+    The top of the deck is the END of the cards list, so drawing is an O(1)
+    pop() rather than shifting every remaining card down.
+    """
 
     def __init__(self):
         self.cards: List[Card] = []
@@ -87,7 +99,7 @@ class Deck:
 
     def draw(self) -> Optional[Card]:
         """Draw a card from the top of the deck"""
-        return self.cards.pop(0) if self.cards else None
+        return self.cards.pop() if self.cards else None
 
 
 class Player:
@@ -102,6 +114,31 @@ class Player:
         self.has_folded = False
         self.has_drawn = False
         self.has_acted = False
+        self.is_hermit = False
+
+        # The AI's OpponentModel for this player, attached on first lookup
+        # by sabacc_ai.get_player_model()
+        self.opponent_model = None
+
+    def remove_card(self, card: Card) -> bool:
+        """
+        Remove one copy of a card from the hand.
+
+        Finds the card with a single scan instead of an `in` check followed
+        by list.remove().
+
+        Args:
+            card: The card tuple (rank, suit) to remove
+
+        Returns:
+            True if the card was in the hand and has been removed
+        """
+        try:
+            index = self.hand.index(card)
+        except ValueError:
+            return False
+        del self.hand[index]
+        return True
 
     def reset_for_new_hand(self):
         """Reset player state for a new hand"""
@@ -139,6 +176,9 @@ class GameState:
         self.judgment_played = False
         self.tiebreaker_info = None
 
+        # Players still in the hand; rebuilt lazily after a fold or new hand
+        self._active_players: Optional[List[Player]] = None
+
     def start_new_hand(self):
         """Initialize a new hand"""
         self.hand_number += 1
@@ -150,6 +190,7 @@ class GameState:
         # Reset all players
         for player in self.players:
             player.reset_for_new_hand()
+        self._active_players = None
 
         # Reset piles - everything goes back into the deck for a fresh shuffle
         self.draw_pile = Deck()
@@ -409,6 +450,7 @@ class GameState:
         """Player folds and is out of the hand"""
         player.has_folded = True
         player.has_acted = True
+        self._active_players = None
         print(f"{player.name} folds.")
 
     def player_call(self, player: Player) -> int:
@@ -475,7 +517,7 @@ class GameState:
 
         # When someone raises, all other active players need to act again
         for p in self.players:
-            if p != player and not p.has_folded and p.credits > 0:
+            if p is not player and not p.has_folded and p.credits > 0:
                 p.has_acted = False
 
         player.has_acted = True
@@ -512,8 +554,31 @@ class GameState:
         return True
 
     def get_active_players(self) -> List[Player]:
-        """Return list of players who haven't folded"""
-        return [p for p in self.players if not p.has_folded]
+        """
+        Return list of players who haven't folded
+
+        The list is cached until the next fold or new hand, so callers
+        must not modify it.
+        """
+        if self._active_players is None:
+            self._active_players = [p for p in self.players if not p.has_folded]
+        return self._active_players
+
+    def active_opponents_of(self, player: Player, include_hermits: bool = True) -> List[Player]:
+        """
+        Return the players still in the hand other than the given one.
+
+        Args:
+            player: The player whose opponents to list
+            include_hermits: If False, also skip players who have withdrawn
+                             with The Hermit
+
+        Returns:
+            New list of opponents in seat order
+        """
+        if include_hermits:
+            return [p for p in self.get_active_players() if p is not player]
+        return [p for p in self.get_active_players() if p is not player and not p.is_hermit]
 
     def advance_dealer(self):
         """Move the dealer button to the next player"""
@@ -590,10 +655,7 @@ class GameState:
             return winner
 
         # Final tiebreaker: suit ranking (Wands > Cups > Swords > Disks)
-        suit_ranking = {'W': 4, 'C': 3, 'S': 2, 'D': 1, 'T': 0}
-        suit_names = {'W': 'Wands', 'C': 'Cups', 'S': 'Swords', 'D': 'Disks', 'T': 'Trionfi'}
-
-        still_tied.sort(key=lambda x: suit_ranking.get(x[2], 0), reverse=True)
+        still_tied.sort(key=lambda x: SUIT_RANKING.get(x[2], 0), reverse=True)
 
         winner = still_tied[0][0]
         winner_suit = still_tied[0][2]
@@ -601,7 +663,7 @@ class GameState:
             'type': 'suit',
             'tied_players': tied_names,
             'tied_values': tied_values,
-            'winner_suit': suit_names.get(winner_suit, winner_suit)
+            'winner_suit': SUIT_NAMES.get(winner_suit, winner_suit)
         }
 
         return winner
@@ -635,8 +697,7 @@ class GameState:
         print(f"\n--- {player.name}'s Turn ---")
 
         # Step 0: Check for The Devil card - give it away if desired
-        devil_card = ('15', 'T')
-        if devil_card in player.hand:
+        if DEVIL_CARD in player.hand:
             handle_devil_card(self, player)
 
         # Step 1: Betting action
@@ -908,7 +969,7 @@ def handle_devil_card(game: GameState, player: Player) -> None:
     Handle The Devil card at the beginning of a player's turn.
     Player can choose to give it to another player.
     """
-    devil_card = ('15', 'T')
+    devil_card = DEVIL_CARD
 
     if player.is_human:
         print(f"\n😈 {player.name}, you have The Devil card (-15 points)!")
@@ -917,7 +978,7 @@ def handle_devil_card(game: GameState, player: Player) -> None:
 
         if choice == 'y':
             # Get active players (not folded)
-            eligible_targets = [p for p in game.players if p != player and not p.has_folded]
+            eligible_targets = game.active_opponents_of(player)
 
             if not eligible_targets:
                 print("No eligible players to give The Devil to.")
@@ -947,7 +1008,7 @@ def handle_devil_card(game: GameState, player: Player) -> None:
         from sabacc_ai import should_give_away_devil, choose_devil_target
 
         if should_give_away_devil(game, player):
-            eligible_targets = [p for p in game.players if p != player and not p.has_folded]
+            eligible_targets = game.active_opponents_of(player)
 
             if eligible_targets:
                 target = choose_devil_target(game, player, eligible_targets)
@@ -990,8 +1051,7 @@ def check_for_hanged_man_interrupt(game: GameState, acting_player: Player, trion
                 game.removed_pile.append(hanged_man_card)
 
                 trionfi_card = (str(trionfi.number), 'T')
-                if trionfi_card in acting_player.hand:
-                    acting_player.hand.remove(trionfi_card)
+                if acting_player.remove_card(trionfi_card):
                     game.removed_pile.append(trionfi_card)
 
                 return True
@@ -1008,52 +1068,73 @@ def check_for_hanged_man_interrupt(game: GameState, acting_player: Player, trion
                 game.removed_pile.append(hanged_man_card)
 
                 trionfi_card = (str(trionfi.number), 'T')
-                if trionfi_card in acting_player.hand:
-                    acting_player.hand.remove(trionfi_card)
+                if acting_player.remove_card(trionfi_card):
                     game.removed_pile.append(trionfi_card)
 
                 return True
 
     return False
 
-def calculate_hand_value(hand: Hand) -> Tuple[int, bool]:
+def card_components(card: Card) -> Tuple[int, int, int]:
     """
-    Calculate the value of a hand, optimizing ace values.
+    Split a card into the parts calculate_hand_value() adds up.
 
-    The winning condition is based on absolute value closest to 23 without exceeding.
-    So a hand worth -21 is as good as +21 (both are 2 away from 23).
+    Every card contributes independently of the rest of the hand, so a
+    hand's value is the sum of its cards' components passed through
+    finalize_hand_value(). Callers that score many hands built from the
+    same cards can add components instead of rescoring each hand.
+    CARD_COMPONENTS holds the result for every card in the deck.
+
+    Args:
+        card: The card tuple (rank, suit)
 
     Returns:
-        (value, is_busted) - the hand value and whether |value| exceeds 23
+        (value, aces, lovers) - face value with aces counted as 1, the
+        number of aces (0 or 1), and 1 if the card is The Lovers
     """
-    value = 0
-    num_aces = 0
-    has_lovers = False
+    rank, suit = card
+    if suit == 'T':  # Trionfi
+        # The Lovers: handled separately at the end
+        if rank == '6':
+            return (0, 0, 1)
+        # Negative values: 2, 3, 8, 11, 13, 14, 15, 16, 17
+        if rank in ('2', '3', '8', '11', '13', '14', '15', '16', '17'):
+            return (-int(rank), 0, 0)
+        # All others worth 0
+        return (0, 0, 0)
+
+    # Regular suits
+    if rank == '1':  # Ace
+        return (1, 1, 0)  # Start with ace as 1
+    if rank == 'K':
+        return (14, 0, 0)
+    if rank == 'Q':
+        return (13, 0, 0)
+    if rank == 'N':
+        return (12, 0, 0)
+    if rank == 'P':
+        return (11, 0, 0)
+    return (int(rank), 0, 0)  # Numbered cards 2-10
+
+
+# card_components() for all 78 cards, so scoring a hand is one dict lookup per card
+CARD_COMPONENTS: Dict[Card, Tuple[int, int, int]] = {
+    card: card_components(card) for card in Deck().cards
+}
+
+
+def finalize_hand_value(value: int, num_aces: int, has_lovers: bool) -> Tuple[int, bool]:
+    """
+    Resolve aces and The Lovers on top of a hand's summed card components.
 
-    for rank, suit in hand:
-        if suit == 'T':  # Trionfi
-            # The Lovers: handle separately at end
-            if rank == '6':
-                has_lovers = True
-            # Negative values: 2, 3, 8, 11, 13, 14, 15, 16, 17
-            elif rank in ('2', '3', '8', '11', '13', '14', '15', '16', '17'):
-                value -= int(rank)
-            # All others worth 0
-        else:  # Regular suits
-            if rank == '1':  # Ace
-                num_aces += 1
-                value += 1  # Start with ace as 1
-            elif rank == 'K':
-                value += 14
-            elif rank == 'Q':
-                value += 13
-            elif rank == 'N':
-                value += 12
-            elif rank == 'P':
-                value += 11
-            else:  # Numbered cards 2-10
-                value += int(rank)
+    Args:
+        value: Sum of the cards' face values (aces counted as 1)
+        num_aces: Number of aces in the hand
+        has_lovers: Whether The Lovers is in the hand
 
+    Returns:
+        (value, is_busted) - as returned by calculate_hand_value()
+    """
     # Optimize aces: for each ace, decide if making it 11 gets us closer to ±23
     for _ in range(num_aces):
         current_distance = abs(abs(value) - 23)
@@ -1077,6 +1158,29 @@ def calculate_hand_value(hand: Hand) -> Tuple[int, bool]:
     is_busted = abs(value) > 23
     return value, is_busted
 
+
+def calculate_hand_value(hand: Hand) -> Tuple[int, bool]:
+    """
+    Calculate the value of a hand, optimizing ace values.
+
+    The winning condition is based on absolute value closest to 23 without exceeding.
+    So a hand worth -21 is as good as +21 (both are 2 away from 23).
+
+    Returns:
+        (value, is_busted) - the hand value and whether |value| exceeds 23
+    """
+    value = 0
+    num_aces = 0
+    has_lovers = 0
+
+    for card in hand:
+        card_value, aces, lovers = CARD_COMPONENTS[card]
+        value += card_value
+        num_aces += aces
+        has_lovers |= lovers
+
+    return finalize_hand_value(value, num_aces, has_lovers)
+
 def get_highest_card_in_hand(hand: Hand) -> Tuple[int, str]:
     """
     Get the value and suit of the highest-value card in a hand.
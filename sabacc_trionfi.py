@@ -3,8 +3,9 @@
 Sabacc con i Tarocchi - Trionfi (Trump) Special Effects
 """
 
-from typing import Callable, Optional
-from sabacc_game import GameState, Player, Card
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+from sabacc_game import DEVIL_CARD, GameState, Player, Card
 
 
 class TrionfiEffect:
@@ -38,8 +39,7 @@ class TrionfiEffect:
             # Remove card from hand unless it stays
             if not self.stays_in_hand:
                 card = (str(self.number), 'T')
-                if card in player.hand:
-                    player.hand.remove(card)
+                if player.remove_card(card):
                     game.removed_pile.append(card)
 
 
@@ -57,8 +57,8 @@ def magician_effect(game: GameState, player: Player) -> None:
         print("Not enough cards in draw pile to use this effect.")
         return
 
-    # Take top 4 cards
-    top_4 = [game.draw_pile.cards.pop(0) for _ in range(4)]
+    # Take top 4 cards (the top of the deck is the end of the list)
+    top_4 = [game.draw_pile.cards.pop() for _ in range(4)]
 
     if player.is_human:
         print(f"\nTop 4 cards: {top_4}")
@@ -77,19 +77,17 @@ def magician_effect(game: GameState, player: Player) -> None:
             except (ValueError, IndexError):
                 print("Invalid input. Try again.")
 
-        # Put cards back in specified order
-        for card in reversed(reordered):
-            game.draw_pile.cards.insert(0, card)
+        # Put cards back in specified order (first card ends up on top)
+        game.draw_pile.cards.extend(reversed(reordered))
 
-        print(f"Cards rearranged. New top card: {game.draw_pile.cards[0]}")
+        print(f"Cards rearranged. New top card: {game.draw_pile.cards[-1]}")
     else:
         # AI arranges cards strategically
         from sabacc_ai import arrange_magician_cards
         arranged = arrange_magician_cards(game, player, top_4)
 
         # Put cards back in arranged order (best on top)
-        for card in reversed(arranged):
-            game.draw_pile.cards.insert(0, card)
+        game.draw_pile.cards.extend(reversed(arranged))
 
         print(f"{player.name} rearranged the top 4 cards strategically.")
 
@@ -103,8 +101,7 @@ def emperor_effect(game: GameState, player: Player) -> None:
     print(f"\n👑 {player.name} plays The Emperor!")
 
     # Get list of other active players
-    targets = [p for p in game.players
-               if p != player and not p.has_folded and not getattr(p, 'is_hermit', False)]
+    targets = game.active_opponents_of(player, include_hermits=False)
 
     if not targets:
         print("No valid targets for The Emperor's effect.")
@@ -195,10 +192,11 @@ def emperor_effect(game: GameState, player: Player) -> None:
             if len(target.hand) >= 2:
                 # Discard 2 lowest cards
                 import random
-                to_discard = random.sample(target.hand, 2)
-                for card in to_discard:
-                    target.hand.remove(card)
-                    game.discard_pile.append(card)
+                # Sample positions rather than cards, then rebuild the hand in one pass
+                indices = random.sample(range(len(target.hand)), 2)
+                to_discard = [target.hand[i] for i in indices]
+                target.hand[:] = [card for i, card in enumerate(target.hand) if i not in indices]
+                game.discard_pile.extend(to_discard)
                 print(f"{target.name} discarded 2 cards.")
             else:
                 game.player_fold(target)
@@ -216,7 +214,7 @@ def hierophant_effect(game: GameState, player: Player) -> None:
     from sabacc_game import calculate_hand_value
 
     for p in game.players:
-        if p == player or p.has_folded or getattr(p, 'is_hermit', False):
+        if p is player or p.has_folded or p.is_hermit:
             continue
 
         if p.is_human:
@@ -248,7 +246,7 @@ def chariot_effect(game: GameState, player: Player) -> None:
     print("All players must discard 1 card or fold!")
 
     for p in game.players:
-        if p == player or p.has_folded or getattr(p, 'is_hermit', False):
+        if p is player or p.has_folded or p.is_hermit:
             continue
 
         if p.is_human:
@@ -402,7 +400,7 @@ def devil_effect(game: GameState, player: Player) -> None:
     """
     print(f"\n😈 {player.name} plays The Devil!")
 
-    targets = [p for p in game.players if p != player and not p.has_folded]
+    targets = game.active_opponents_of(player)
 
     if not targets:
         print("No one to give The Devil to!")
@@ -426,9 +424,8 @@ def devil_effect(game: GameState, player: Player) -> None:
         target = random.choice(targets)
 
     # Transfer the card
-    devil_card = ('15', 'T')
-    if devil_card in player.hand:
-        player.hand.remove(devil_card)
+    devil_card = DEVIL_CARD
+    if player.remove_card(devil_card):
         target.hand.append(devil_card)
         print(f"{player.name} gives The Devil to {target.name}!")
 
@@ -444,8 +441,7 @@ def moon_effect(game: GameState, player: Player) -> None:
     print(f"\n🌙 {player.name} plays The Moon!")
 
     # Remove The Moon from player's hand
-    if moon_card in player.hand:
-        player.hand.remove(moon_card)
+    if player.remove_card(moon_card):
         game.removed_pile.append(moon_card)
 
     # Dealer deals another community card
@@ -504,16 +500,15 @@ def universe_effect(game: GameState, player: Player) -> None:
     print(f"\n🌌 {player.name} plays The Universe - See the Future!")
 
     # Remove The Universe from player's hand
-    if universe_card in player.hand:
-        player.hand.remove(universe_card)
+    if player.remove_card(universe_card):
         game.removed_pile.append(universe_card)
 
     if len(game.draw_pile.cards) < 6:
         print("Not enough cards in draw pile to use this effect.")
         return
 
-    # Take top 6 cards
-    top_6 = game.draw_pile.cards[:6]
+    # Take top 6 cards, top first (the top of the deck is the end of the list)
+    top_6 = game.draw_pile.cards[-6:][::-1]
 
     if player.is_human:
         print(f"\nTop 6 cards (in order from top to bottom): {top_6}")
@@ -572,9 +567,20 @@ def get_playable_trionfi(player: Player) -> list:
     """
     Get list of Trionfi cards in player's hand that have effects.
     """
+    return list(_playable_for_hand(tuple(player.hand)))
+
+
+@lru_cache(maxsize=256)
+def _playable_for_hand(hand: Tuple[Card, ...]) -> Tuple[Tuple[Card, TrionfiEffect], ...]:
+    """
+    Playable Trionfi for a given hand, memoized on the hand's contents.
+
+    The answer only changes when the hand does, and the GUI asks on every
+    button refresh, so repeated calls for the same hand skip the scan.
+    """
     playable = []
-    for card in player.hand:
+    for card in hand:
         trionfi = get_trionfi_effect(card)
         if trionfi and trionfi.effect:
             playable.append((card, trionfi))
-    return playable
\ No newline at end of file
+    return tuple(playable)
\ No newline at end of file